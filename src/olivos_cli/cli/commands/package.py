@@ -56,13 +56,12 @@ def cmd_package(config_manager: ConfigManager, args) -> int:
 def _cmd_package_install(pkg_mgr, install_path: Path, args) -> int:
     """安装依赖"""
     if args.packages:
-        # 安装指定的包
-        for package in args.packages:
-            try:
-                pkg_mgr.add(package, install_path)
-            except PackageError as e:
-                logger.error_print(str(e))
-                return 1
+        # 安装指定的包（一次调用，统一解析依赖）
+        try:
+            pkg_mgr.add_many(list(args.packages), install_path)
+        except PackageError as e:
+            logger.error_print(str(e))
+            return 1
     else:
         # 安装全部依赖 - 使用共享的 requirements 文件选择函数
         requirements_file = get_requirements_file(install_path)
@@ -53,6 +53,7 @@ class AdapterConfig:
     # 帮助信息
     help_text: str = ""
 
+
 # 1. onebotV11 - QQ 平台
 ONEBOTV11_MODEL_TYPES = {
     "default": "默认模式",
@@ -178,6 +179,7 @@ VIRTUAL_TERMINAL_MODEL_TYPES = {
     "ff14": "FF14 终端",
 }
 
+
 ALL_ADAPTERS: dict[str, AdapterConfig] = {
     # 1. onebotV11 - QQ 平台
     "onebotV11": AdapterConfig(
@@ -449,6 +451,7 @@ ALL_ADAPTERS: dict[str, AdapterConfig] = {
     ),
 }
 
+
 ADAPTER_GROUPS: dict[str, list[str]] = {
     "QQ 平台": ["onebotV11", "onebotV12", "qqGuild", "qqGuildV2", "OPQBot", "red"],
     "通讯软件": ["telegram", "discord", "kaiheila", "dingtalk", "fanbook"],
@@ -457,6 +460,21 @@ ADAPTER_GROUPS: dict[str, list[str]] = {
 }
 
 
+# (platform_type, sdk_type, model_type) -> AdapterConfig 索引，避免逐个扫描 ALL_ADAPTERS
+_ADAPTER_INDEX: dict[tuple[str, str, str], AdapterConfig] = {}
+
+
+def _rebuild_index() -> None:
+    """重建适配器索引，修改 ALL_ADAPTERS 后需调用"""
+    _ADAPTER_INDEX.clear()
+    for config in ALL_ADAPTERS.values():
+        # 保持与线性查找一致：同一三元组以先出现者为准
+        _ADAPTER_INDEX.setdefault((config.platform_type, config.sdk_type, config.model_type), config)
+
+
+_rebuild_index()
+
+
 def get_adapter_config(key: str) -> AdapterConfig | None:
     """获取适配器配置"""
     return ALL_ADAPTERS.get(key)
@@ -464,12 +482,7 @@ def get_adapter_config(key: str) -> AdapterConfig | None:
 
 def get_adapter_by_platform_sdk(platform: str, sdk: str, model: str) -> AdapterConfig | None:
     """根据 platform_type、sdk_type、model_type 查找适配器"""
-    for config in ALL_ADAPTERS.values():
-        if (config.platform_type == platform and
-            config.sdk_type == sdk and
-            config.model_type == model):
-            return config
-    return None
+    return _ADAPTER_INDEX.get((platform, sdk, model))
 
 
 def list_adapter_configs() -> list[AdapterConfig]:
@@ -4,24 +4,17 @@
 处理 TOML 配置文件读写
 """
 
+import dataclasses
+import functools
+import importlib
+import importlib.util
+import operator
 import os
 import sys
+import typing
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        tomllib = None
-
-try:
-    import tomli_w
-except ImportError:
-    tomli_w = None
+from typing import Any, Callable, Optional
 
 from .const import (
     CACHE_DIR,
@@ -42,26 +35,183 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# TOML 库仅在读写配置时才导入，这里只探测是否可用
+_TOMLLIB_MODULE = "tomllib" if sys.version_info >= (3, 11) else "tomli"
+_HAS_TOMLLIB = importlib.util.find_spec(_TOMLLIB_MODULE) is not None
+_HAS_TOMLI_W = importlib.util.find_spec("tomli_w") is not None
 
-def expand_path(path: str) -> Path:
-    """扩展路径中的 ~ 和环境变量"""
+
+@functools.lru_cache(maxsize=256)
+def _expand_path_cached(path: str) -> Path:
     expanded = os.path.expanduser(path)
     expanded = os.path.expandvars(expanded)
     return Path(expanded)
 
 
+def expand_path(path: str) -> Path:
+    """扩展路径中的 ~ 和环境变量（结果按输入字符串缓存）"""
+    return _expand_path_cached(path)
+
+
+def _absolute_path(path: str) -> Path:
+    """扩展并转换为绝对路径
+
+    仅做词法规范化（os.path.abspath），不解析符号链接，避免 resolve() 对每一级目录的 lstat。
+    需要符号链接真实路径时请对结果调用 resolve()。
+    """
+    return Path(os.path.abspath(expand_path(path)))
+
+
+_HOME_STR = str(Path.home())
+_HOME_PREFIX = os.path.join(_HOME_STR, "")
+
+
 def path_to_str(path: Path) -> str:
     """将 Path 转换为字符串，尽可能使用 ~ 缩写"""
-    home = Path.home()
-    try:
-        if path.is_relative_to(home):
-            return "~/" + str(path.relative_to(home))
-    except (TypeError, AttributeError):
-        pass
-    return str(path)
+    s = os.fspath(path)
+    if s.startswith(_HOME_PREFIX):
+        return "~/" + s[len(_HOME_PREFIX):]
+    if s == _HOME_STR:
+        return "~"
+    return s
+
+
+def _is_dataclass_type(tp: Any) -> bool:
+    return isinstance(tp, type) and dataclasses.is_dataclass(tp)
+
+
+def _make_to_dict(cls: type):
+    """为 dataclass 生成专用的 _to_dict 方法
+
+    直接读取各字段并只对嵌套 dataclass 递归，None 值在同一次遍历中过滤，
+    避免 dataclasses.asdict 的反射遍历与深拷贝。
+    """
+    lines = ["def _to_dict(self):", "    d = {}"]
+    for f in dataclasses.fields(cls):
+        args = typing.get_args(f.type)
+        if _is_dataclass_type(f.type):
+            value = "v._to_dict()"
+        elif typing.get_origin(f.type) is list and args and _is_dataclass_type(args[0]):
+            value = "[i._to_dict() for i in v if i is not None]"
+        else:
+            value = "v"
+        lines.append(f"    v = self.{f.name}")
+        lines.append("    if v is not None:")
+        lines.append(f"        d[{f.name!r}] = {value}")
+    lines.append("    return d")
+
+    src = "\n".join(lines) + "\n"
+    namespace: dict[str, Any] = {}
+    exec(src, namespace)
+    fn = namespace["_to_dict"]
+    fn.__qualname__ = f"{cls.__qualname__}._to_dict"
+    return fn
+
+
+def _make_from_dict(cls: type):
+    """为 dataclass 生成专用的 _from_dict 构造函数
+
+    按字段名直接从映射中取值并构造嵌套 dataclass，未知键被忽略，
+    省去过滤字典与 ** 解包的开销。
+    """
+    namespace: dict[str, Any] = {"_cls": cls}
+    args = []
+    for i, f in enumerate(dataclasses.fields(cls)):
+        if not f.init:
+            continue
+        key = f.name
+        item_args = typing.get_args(f.type)
+        if _is_dataclass_type(f.type) and f.default_factory is not dataclasses.MISSING:
+            # 嵌套配置段：字典经 _from_dict 构造，已构造的对象原样使用，缺失时取默认值
+            namespace[f"_conv{i}"] = f.type._from_dict
+            namespace[f"_fact{i}"] = f.default_factory
+            args.append(
+                f"{key}=(_conv{i}(v) if isinstance(v := d.get({key!r}), dict) "
+                f"else _fact{i}() if v is None else v)"
+            )
+            continue
+        elif _is_dataclass_type(f.type):
+            namespace[f"_conv{i}"] = f.type._from_dict
+            value = f"_conv{i}(d[{key!r}])"
+        elif typing.get_origin(f.type) is list and item_args and _is_dataclass_type(item_args[0]):
+            namespace[f"_conv{i}"] = item_args[0]._from_dict
+            value = f"[_conv{i}(x) for x in d[{key!r}]]"
+        else:
+            value = None
+
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_dflt{i}"] = f.default
+            fallback = f"_dflt{i}"
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"_fact{i}"] = f.default_factory
+            fallback = f"_fact{i}()"
+        else:
+            args.append(f"{key}={value or f'd[{key!r}]'}")
+            continue
+
+        if value is None:
+            args.append(f"{key}=d.get({key!r}, {fallback})")
+        else:
+            args.append(f"{key}={value} if {key!r} in d else {fallback}")
+
+    src = "def _from_dict(d):\n" f"    return _cls({', '.join(args)})\n"
+    exec(src, namespace)
+    fn = namespace["_from_dict"]
+    fn.__qualname__ = f"{cls.__qualname__}._from_dict"
+    return fn
+
+
+class _keyed_cached_path:
+    """兼容 __slots__ 的带校验键缓存属性
+
+    在实例的 _expanded 槽位字典中缓存 (key(obj), 结果)，每次访问先比较校验键，
+    键变化时才重新计算。字段被重新赋值或原地修改后都能感知，无需拦截属性赋值。
+    """
+
+    def __init__(self, key: Callable[[Any], Any]):
+        self.key = key
+
+    def __call__(self, func: Callable[[Any], Any]) -> "_keyed_cached_path":
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+        return self
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            cache = obj._expanded
+        except AttributeError:
+            cache = {}
+            obj._expanded = cache
+        key = self.key(obj)
+        entry = cache.get(self.name)
+        if entry is None or entry[0] != key:
+            entry = cache[self.name] = (key, self.func(obj))
+        return entry[1]
 
 
-@dataclass
+def _cached_path(source: str) -> _keyed_cached_path:
+    """以来源字段的当前值为校验键的 _keyed_cached_path"""
+    return _keyed_cached_path(operator.attrgetter(source))
+
+
+class _ExpandedPathCache:
+    """提供 expanded_* 缓存所需的 _expanded 槽位（slots dataclass 不能动态添加属性）"""
+
+    __slots__ = ("_expanded",)
+
+
+def _serializable(cls: type) -> type:
+    """类装饰器：在类定义时为 dataclass 挂载生成的序列化/反序列化方法"""
+    cls._to_dict = _make_to_dict(cls)
+    cls._from_dict = staticmethod(_make_from_dict(cls))
+    return cls
+
+
+@_serializable
+@dataclass(slots=True)
 class CLIConfig:
     """CLI 配置"""
 
@@ -76,8 +226,9 @@ class CLIConfig:
             self.log_file = expand_path(str(self.log_file))
 
 
-@dataclass
-class GitConfig:
+@_serializable
+@dataclass(slots=True)
+class GitConfig(_ExpandedPathCache):
     """Git 配置"""
 
     repo_url: str = DEFAULT_REPO_URL
@@ -89,17 +240,18 @@ class GitConfig:
     depth: int = 1
     auto_pull: bool = True
 
-    @property
+    @_cached_path("install_path")
     def expanded_install_path(self) -> Path:
-        return expand_path(self.install_path).resolve()
+        return _absolute_path(self.install_path)
 
     @property
     def effective_url(self) -> str:
         return self.mirror_url if self.use_mirror else self.repo_url
 
 
-@dataclass
-class PackageUVConfig:
+@_serializable
+@dataclass(slots=True)
+class PackageUVConfig(_ExpandedPathCache):
     """UV 包管理器配置"""
 
     python_version: str = "3.11"
@@ -107,12 +259,13 @@ class PackageUVConfig:
     index_url: str = "https://mirrors.tuna.tsinghua.edu.cn/pypi/web/simple"
     extra_index_url: list[str] = field(default_factory=list)
 
-    @property
+    @_cached_path("cache_dir")
     def expanded_cache_dir(self) -> Path:
-        return expand_path(self.cache_dir).resolve()
+        return _absolute_path(self.cache_dir)
 
 
-@dataclass
+@_serializable
+@dataclass(slots=True)
 class PackageConfig:
     """包管理器配置"""
 
@@ -123,11 +276,10 @@ class PackageConfig:
     def __post_init__(self):
         if self.manager not in PACKAGE_MANAGERS:
             raise ConfigError(f"包管理器在当前环境无效: {self.manager}")
-        if isinstance(self.uv, dict):
-            self.uv = PackageUVConfig(**self.uv)
 
 
-@dataclass
+@_serializable
+@dataclass(slots=True)
 class SystemdRuntimeConfig:
     """systemd 运行时配置"""
 
@@ -143,8 +295,9 @@ class SystemdRuntimeConfig:
             self.working_directory = "./OlivOS"
 
 
-@dataclass
-class SystemdConfig:
+@_serializable
+@dataclass(slots=True)
+class SystemdConfig(_ExpandedPathCache):
     """systemd 配置"""
 
     user_mode: bool = True
@@ -152,16 +305,13 @@ class SystemdConfig:
     service_name: str = DEFAULT_SERVICE_NAME
     runtime: SystemdRuntimeConfig = field(default_factory=SystemdRuntimeConfig)
 
-    @property
+    @_cached_path("service_dir")
     def expanded_service_dir(self) -> Path:
-        return expand_path(self.service_dir).resolve()
-
-    def __post_init__(self):
-        if isinstance(self.runtime, dict):
-            self.runtime = SystemdRuntimeConfig(**self.runtime)
+        return _absolute_path(self.service_dir)
 
 
-@dataclass
+@_serializable
+@dataclass(slots=True)
 class OlivOSBasicConfig:
     """OlivOS 基本配置"""
 
@@ -170,8 +320,9 @@ class OlivOSBasicConfig:
     plugin_auto_restart: bool = True
 
 
-@dataclass
-class OlivOSConfig:
+@_serializable
+@dataclass(slots=True)
+class OlivOSConfig(_ExpandedPathCache):
     """OlivOS 配置"""
 
     root_path: str = "./OlivOS"
@@ -180,29 +331,26 @@ class OlivOSConfig:
     log_path: str = "~/.local/state/olivos"
     basic: OlivOSBasicConfig = field(default_factory=OlivOSBasicConfig)
 
-    @property
+    @_cached_path("root_path")
     def expanded_root_path(self) -> Path:
-        return expand_path(self.root_path).resolve()
+        return _absolute_path(self.root_path)
 
-    @property
+    @_cached_path("conf_path")
     def expanded_conf_path(self) -> Path:
-        return expand_path(self.conf_path).resolve()
+        return _absolute_path(self.conf_path)
 
-    @property
+    @_cached_path("plugin_path")
     def expanded_plugin_path(self) -> Path:
-        return expand_path(self.plugin_path).resolve()
+        return _absolute_path(self.plugin_path)
 
-    @property
+    @_cached_path("log_path")
     def expanded_log_path(self) -> Path:
-        return expand_path(self.log_path).resolve()
-
-    def __post_init__(self):
-        if isinstance(self.basic, dict):
-            self.basic = OlivOSBasicConfig(**self.basic)
+        return _absolute_path(self.log_path)
 
 
-@dataclass
-class LoggingConfig:
+@_serializable
+@dataclass(slots=True)
+class LoggingConfig(_ExpandedPathCache):
     """日志配置"""
 
     olivos_log_file: str = "~/.local/state/olivos/olivos.log"
@@ -210,12 +358,13 @@ class LoggingConfig:
     max_size_mb: int = 100
     keep_days: int = 30
 
-    @property
+    @_cached_path("olivos_log_file")
     def expanded_log_file(self) -> Path:
-        return expand_path(self.olivos_log_file).resolve()
+        return _absolute_path(self.olivos_log_file)
 
 
-@dataclass
+@_serializable
+@dataclass(slots=True)
 class MonitoringConfig:
     """监控配置"""
 
@@ -223,8 +372,9 @@ class MonitoringConfig:
     health_check_endpoint: Optional[str] = None
 
 
-@dataclass
-class PluginsConfig:
+@_serializable
+@dataclass(slots=True)
+class PluginsConfig(_ExpandedPathCache):
     """插件配置"""
 
     plugin_dirs: list[str] = field(
@@ -232,13 +382,14 @@ class PluginsConfig:
     )
     auto_load: list[str] = field(default_factory=list)
 
-    @property
-    def expanded_plugin_dirs(self) -> list[Path]:
-        return [expand_path(p).resolve() for p in self.plugin_dirs]
+    @_keyed_cached_path(key=lambda self: tuple(self.plugin_dirs))
+    def expanded_plugin_dirs(self) -> tuple[Path, ...]:
+        return tuple(_absolute_path(p) for p in self.plugin_dirs)
 
 
-@dataclass
-class InstanceConfig:
+@_serializable
+@dataclass(slots=True)
+class InstanceConfig(_ExpandedPathCache):
     """实例配置"""
 
     name: str = "primary"
@@ -247,13 +398,14 @@ class InstanceConfig:
     enabled: bool = True
     branch: str = DEFAULT_BRANCH
 
-    @property
+    @_cached_path("path")
     def expanded_path(self) -> Path:
-        return expand_path(self.path).resolve()
+        return _absolute_path(self.path)
 
 
-@dataclass
-class AdvancedConfig:
+@_serializable
+@dataclass(slots=True)
+class AdvancedConfig(_ExpandedPathCache):
     """高级配置"""
 
     update_strategy: str = "auto"
@@ -261,11 +413,12 @@ class AdvancedConfig:
     backup_dir: str = "~/.local/share/olivos-cli/backups"
     concurrent_downloads: int = 4
 
-    @property
+    @_cached_path("backup_dir")
     def expanded_backup_dir(self) -> Path:
-        return expand_path(self.backup_dir).resolve()
+        return _absolute_path(self.backup_dir)
 
 
+@_serializable
 @dataclass
 class Config:
     """OlivOS-CLI 总配置"""
@@ -284,44 +437,11 @@ class Config:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         """从字典创建配置对象"""
-        config = cls()
-
-        if "cli" in data:
-            config.cli = CLIConfig(**_filter_keys(CLIConfig, data["cli"]))
-        if "git" in data:
-            config.git = GitConfig(**_filter_keys(GitConfig, data["git"]))
-        if "package" in data:
-            config.package = PackageConfig(**_filter_keys(PackageConfig, data["package"]))
-        if "systemd" in data:
-            config.systemd = SystemdConfig(**_filter_keys(SystemdConfig, data["systemd"]))
-        if "olivos" in data:
-            config.olivos = OlivOSConfig(**_filter_keys(OlivOSConfig, data["olivos"]))
-        if "logging" in data:
-            config.logging = LoggingConfig(**_filter_keys(LoggingConfig, data["logging"]))
-        if "monitoring" in data:
-            config.monitoring = MonitoringConfig(**_filter_keys(MonitoringConfig, data["monitoring"]))
-        if "plugins" in data:
-            config.plugins = PluginsConfig(**_filter_keys(PluginsConfig, data["plugins"]))
-        if "advanced" in data:
-            config.advanced = AdvancedConfig(**_filter_keys(AdvancedConfig, data["advanced"]))
-        if "instances" in data:
-            config.instances = [InstanceConfig(**_filter_keys(InstanceConfig, i)) for i in data["instances"]]
-
-        return config
+        return cls._from_dict(data)
 
     def to_dict(self) -> dict[str, Any]:
         """转换为字典，过滤掉 None 值"""
-        from dataclasses import asdict
-
-        def filter_none(obj):
-            """递归过滤掉 None 值"""
-            if isinstance(obj, dict):
-                return {k: filter_none(v) for k, v in obj.items() if v is not None}
-            elif isinstance(obj, list):
-                return [filter_none(item) for item in obj if item is not None]
-            return obj
-
-        return filter_none(asdict(self))
+        return self._to_dict()
 
     def validate(self) -> list[str]:
         """验证配置，返回错误列表"""
@@ -342,13 +462,17 @@ class Config:
         return errors
 
 
-def _filter_keys(dataclass_cls: type, data: dict[str, Any]) -> dict[str, Any]:
-    """过滤字典，只保留 dataclass 中定义的字段"""
-    import dataclasses
-    # 获取 dataclass 的所有字段名
-    field_names = {f.name for f in dataclasses.fields(dataclass_cls)}
-    # 只保留有效的字段
-    return {k: v for k, v in data.items() if k in field_names}
+@functools.lru_cache(maxsize=256)
+def _key_getter(key: str) -> Callable[[Any], Any]:
+    """编译点分配置键为属性访问器"""
+    return operator.attrgetter(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _key_setter(key: str) -> tuple[Optional[Callable[[Any], Any]], str]:
+    """编译点分配置键为 (父对象访问器, 末级属性名)"""
+    parent, _, leaf = key.rpartition(".")
+    return (operator.attrgetter(parent) if parent else None), leaf
 
 
 class ConfigManager:
@@ -357,6 +481,8 @@ class ConfigManager:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or CONFIG_FILE
         self._config: Optional[Config] = None
+        # 与 _config 对应的配置文件指纹 (st_mtime_ns, st_size)，None 表示内存中的配置已改动
+        self._fingerprint: Optional[tuple[int, int]] = None
 
     @property
     def config(self) -> Config:
@@ -366,26 +492,37 @@ class ConfigManager:
         return self._config
 
     def load(self, force: bool = False) -> Config:
-        """加载配置文件"""
+        """加载配置文件
+
+        force=True 时若文件的修改时间与大小均未变化，且内存中的配置未经 set/reset 改动，
+        则直接返回已加载的配置而不重新解析。
+        """
         if self._config is not None and not force:
             return self._config
 
-        if not self.config_path.exists():
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             logger.debug(f"配置文件不存在: {self.config_path}")
             self._config = Config()
+            self._fingerprint = None
             return self._config
 
-        if tomllib is None:
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        if self._config is not None and fingerprint == self._fingerprint:
+            return self._config
+
+        if not _HAS_TOMLLIB:
             raise ConfigError(
                 "缺少 TOML 解析库。\n"
                 f"当前 Python 版本: {sys.version_info.major}.{sys.version_info.minor}\n"
                 "请安装 tomli: pip install tomli tomli-w"
             )
 
+        tomllib = importlib.import_module(_TOMLLIB_MODULE)
         try:
-            with open(self.config_path, "rb") as f:
-                data = tomllib.load(f)
-            self._config = Config.from_dict(data)
+            self._config = Config.from_dict(tomllib.loads(self.config_path.read_bytes().decode("utf-8")))
+            self._fingerprint = fingerprint
             logger.debug(f"配置已加载: {self.config_path}")
         except Exception as e:
             raise ConfigError(f"加载配置文件失败: {e}") from e
@@ -399,7 +536,7 @@ class ConfigManager:
             raise ConfigError("没有可保存的配置")
 
         # 检查 TOML 写入库是否可用
-        if tomli_w is None:
+        if not _HAS_TOMLI_W:
             raise ConfigError(
                 "缺少 TOML 写入库。\n"
                 f"当前 Python 版本: {sys.version_info.major}.{sys.version_info.minor}\n"
@@ -414,76 +551,57 @@ class ConfigManager:
         # 确保目录存在
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
+        import tomli_w
+
         try:
             data = config.to_dict()
 
             with open(self.config_path, "wb") as f:
                 tomli_w.dump(data, f)
 
+            if config is self._config:
+                st = self.config_path.stat()
+                self._fingerprint = (st.st_mtime_ns, st.st_size)
+            else:
+                self._fingerprint = None
+
             logger.info(f"配置已保存: {self.config_path}")
         except Exception as e:
             raise ConfigError(f"保存配置文件失败: {e}") from e
 
-    def _dict_to_toml(self, data: dict, indent: int = 0) -> str:
-        """字典转 TOML (回退方案)"""
-        lines = []
-        prefix = " " * indent
-
-        for key, value in data.items():
-            if isinstance(value, dict):
-                lines.append(f"{prefix}[{key}]")
-                lines.append(self._dict_to_toml(value, indent))
-            elif isinstance(value, list):
-                lines.append(f"{prefix}{key} = []")
-            elif isinstance(value, bool):
-                lines.append(f"{prefix}{key} = {str(value).lower()}")
-            elif isinstance(value, str):
-                lines.append(f'{prefix}{key} = "{value}"')
-            elif isinstance(value, (int, float)):
-                lines.append(f"{prefix}{key} = {value}")
-            elif value is None:
-                continue
-
-        return "\n".join(lines)
-
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值"""
-        keys = key.split(".")
-        value = self.config
-
-        for k in keys:
-            if hasattr(value, k):
-                value = getattr(value, k)
-            else:
-                return default
-
-        return value
+        try:
+            return _key_getter(key)(self.config)
+        except AttributeError:
+            return default
 
     def set(self, key: str, value: Any) -> None:
         """设置配置值"""
-        keys = key.split(".")
+        parent_getter, leaf = _key_setter(key)
         config = self._config or self.config
 
-        obj = config
-        for k in keys[:-1]:
-            if hasattr(obj, k):
-                obj = getattr(obj, k)
-            else:
-                raise ConfigError(f"无效的配置键: {key}")
+        try:
+            obj = parent_getter(config) if parent_getter is not None else config
+        except AttributeError:
+            raise ConfigError(f"无效的配置键: {key}") from None
 
-        if not hasattr(obj, keys[-1]):
+        if not hasattr(obj, leaf):
             raise ConfigError(f"无效的配置键: {key}")
 
-        setattr(obj, keys[-1], value)
+        setattr(obj, leaf, value)
+        self._fingerprint = None
 
     def reset(self) -> Config:
         """重置为默认配置"""
         self._config = Config()
+        self._fingerprint = None
         return self._config
 
     def init_default_config(self) -> None:
         """初始化默认配置文件"""
         self._config = Config()
+        self._fingerprint = None
         self.save()
         logger.success(f"默认配置已创建: {self.config_path}")
 
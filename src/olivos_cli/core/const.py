@@ -3,6 +3,7 @@
 """
 
 from pathlib import Path
+from types import MappingProxyType
 
 # =============================================================================
 # 路径常量
@@ -36,7 +37,7 @@ DEFAULT_SERVICE_NAME = "olivos-cli"
 # 支持的适配器列表
 # =============================================================================
 
-SUPPORTED_ADAPTERS = {
+SUPPORTED_ADAPTERS = MappingProxyType({
     "onebot": {
         "sdk_type": "onebot",
         "platform_type": "qq",
@@ -121,18 +122,18 @@ SUPPORTED_ADAPTERS = {
         "name": "虚拟终端",
         "description": "虚拟终端适配器（用于测试）",
     },
-}
+})
 
-ADAPTER_TYPE_CHOICES = list(SUPPORTED_ADAPTERS.keys())
+ADAPTER_TYPE_CHOICES = tuple(SUPPORTED_ADAPTERS)
 
 # =============================================================================
 # 包管理器类型
 # =============================================================================
 
-PACKAGE_MANAGERS = ["uv", "pip", "poetry", "rye", "pdm"]
+PACKAGE_MANAGERS = frozenset({"uv", "pip", "poetry", "rye", "pdm"})
 
 # =============================================================================
 # 日志级别
 # =============================================================================
 
-LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
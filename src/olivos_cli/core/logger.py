@@ -6,20 +6,32 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 from .const import LOG_DIR, LOG_LEVELS
 
+# 日志格式化器无状态，模块级共享，避免每次 setup 重复构造
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(name)s | %(message)s",
+    datefmt="[%Y-%m-%d %H:%M:%S]",
+)
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 class OlivOSLogger:
     """OlivOS-CLI 日志管理器"""
 
     _instance: Optional["OlivOSLogger"] = None
     _logger: Optional[logging.Logger] = None
-    _console: Optional[Console] = None
+    _console: Optional["Console"] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -29,7 +41,6 @@ class OlivOSLogger:
     def __init__(self):
         if self._logger is not None:
             return
-        self._console = Console()
         self._logger = logging.getLogger("olivos-cli")
         self._logger.setLevel(logging.DEBUG)
         self._logger.propagate = False
@@ -41,9 +52,12 @@ class OlivOSLogger:
         return self._logger
 
     @property
-    def console(self) -> Console:
+    def console(self) -> "Console":
+        # 延迟导入 rich.console，未输出内容的命令路径无需付出其导入开销
         if self._console is None:
-            self.__init__()
+            from rich.console import Console
+
+            self._console = Console()
         return self._console
 
     def setup(
@@ -71,6 +85,8 @@ class OlivOSLogger:
 
         level = getattr(logging, log_level.upper(), logging.INFO)
 
+        from rich.logging import RichHandler
+
         # 控制台处理器 (使用 RichHandler)
         console_handler = RichHandler(
             console=self.console,
@@ -81,11 +97,7 @@ class OlivOSLogger:
             markup=True,
         )
         console_handler.setLevel(level)
-        console_formatter = logging.Formatter(
-            "%(name)s | %(message)s",
-            datefmt="[%Y-%m-%d %H:%M:%S]",
-        )
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         self.logger.addHandler(console_handler)
 
         # 文件处理器
@@ -93,11 +105,7 @@ class OlivOSLogger:
             log_file.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter(
-                "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
             self.logger.addHandler(file_handler)
 
     def debug(self, msg: str, **kwargs):
@@ -130,8 +138,6 @@ class OlivOSLogger:
     def error_print(self, msg: str):
         """输出错误消息"""
         # 使用 Text 避免解析消息中的方括号
-        from rich.text import Text
-
         text = Text()
         text.append("C: ", style="bold red")
         text.append(str(msg))
@@ -139,8 +145,6 @@ class OlivOSLogger:
 
     def step(self, msg: str):
         """输出步骤消息"""
-        from rich.text import Text
-
         text = Text()
         text.append("> ", style="bold blue")
         text.append(str(msg))
@@ -148,8 +152,6 @@ class OlivOSLogger:
 
     def verbose(self, msg: str, indent: int = 2):
         """输出详细日志（灰色缩进）"""
-        from rich.text import Text
-
         text = Text()
         prefix = "  " * indent
         text.append(prefix, style="dim")
@@ -158,8 +160,6 @@ class OlivOSLogger:
 
     def raw_output(self, msg: str):
         """输出原始内容（不添加前缀）"""
-        from rich.text import Text
-
         text = Text()
         text.append(str(msg), style="dim")
         self.console.print(text)
@@ -7,13 +7,17 @@ https://doc.olivos.wiki/User/Account/
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from .adapters import ALL_ADAPTERS, get_adapter_config
+from .adapters import get_adapter_by_platform_sdk, get_adapter_config
 from .logger import get_logger
 
 logger = get_logger()
 
+# 字段缺失哨兵，区分“不存在”与值为 None/""
+_MISSING = object()
+
 
 @dataclass
 class ValidationResult:
@@ -51,31 +55,36 @@ def validate_account_config(account_data: dict, adapter_key: str | None = None)
         result.add_error("缺少必填字段: sdk_type")
     if "model_type" not in account_data:
         account_data["model_type"] = "default"
+    model = account_data["model_type"]
 
     # 如果指定了适配器，使用适配器规则校验
     if adapter_key:
         adapter = get_adapter_config(adapter_key)
         if adapter:
-            return _validate_with_adapter(account_data, adapter)
+            return _validate_with_adapter(account_data, adapter, model)
 
     # 尝试根据 platform_type + sdk_type + model_type 查找适配器
     platform = account_data.get("platform_type", "")
     sdk = account_data.get("sdk_type", "")
-    model = account_data.get("model_type", "default")
 
-    for adapter in ALL_ADAPTERS.values():
-        if (adapter.platform_type == platform and
-            adapter.sdk_type == sdk and
-            adapter.model_type == model):
-            return _validate_with_adapter(account_data, adapter)
+    adapter = get_adapter_by_platform_sdk(platform, sdk, model)
+    if adapter is not None:
+        return _validate_with_adapter(account_data, adapter, model)
 
     # 未找到匹配的适配器配置，进行基础校验
     return _validate_basic(account_data, result)
 
 
-def _validate_with_adapter(account_data: dict, adapter) -> ValidationResult:
-    """使用适配器配置校验"""
-    result = ValidationResult(valid=True)
+def _validate_with_adapter(account_data: dict, adapter, model: str | None = None) -> ValidationResult:
+    """使用适配器配置校验
+
+    model 为已取出的 model_type，未传入时从 account_data 中读取。
+    """
+    if model is None:
+        model = account_data.get("model_type", "")
+    errors: list[str] = []
+    warnings: list[str] = []
+    optional_set = frozenset(adapter.optional_fields)
 
     # 检查所需字段
     for field in adapter.required_fields:
@@ -83,106 +92,148 @@ def _validate_with_adapter(account_data: dict, adapter) -> ValidationResult:
             # 嵌套字段，如 server.host
             parts = field.split(".")
             obj = account_data
-            for i, part in enumerate(parts):
-                if part not in obj:
-                    if i == len(parts) - 1:
-                        result.add_error(f"缺少必填字段: {field}")
+            for part in parts[:-1]:
+                obj = obj.get(part, _MISSING) if isinstance(obj, dict) else _MISSING
+                if obj is _MISSING:
+                    errors.append(f"缺少必填字段: {field}")
                     break
-                obj = obj[part]
             else:
-                # 检查是否为空
-                if obj[parts[-1]] == "" and field not in adapter.optional_fields:
-                    result.add_warning(f"字段 {field} 建议填写")
+                value = obj.get(parts[-1], _MISSING) if isinstance(obj, dict) else _MISSING
+                if value is _MISSING:
+                    errors.append(f"缺少必填字段: {field}")
+                elif value == "" and field not in optional_set:
+                    warnings.append(f"字段 {field} 建议填写")
         else:
-            if field not in account_data:
-                result.add_error(f"缺少必填字段: {field}")
-            elif account_data[field] == "" and field not in adapter.optional_fields:
-                result.add_warning(f"字段 {field} 建议填写")
+            value = account_data.get(field, _MISSING)
+            if value is _MISSING:
+                errors.append(f"缺少必填字段: {field}")
+            elif value == "" and field not in optional_set:
+                warnings.append(f"字段 {field} 建议填写")
 
     # 检查 server 配置
-    if "server" in account_data and account_data["server"]:
-        server = account_data["server"]
+    server = account_data.get("server")
+    if server:
         # server 可能是 dict 或 AccountServer 对象
         if hasattr(server, 'to_dict'):
             server = server.to_dict()
         server_type = server.get("type", adapter.server_type.value)
+        host = server.get("host")
 
-        # WebSocket 类型需要 host 和 port
+        # WebSocket 类型需要 host 或 url（自动模式下可以不填）
         if server_type == "websocket":
-            if not server.get("host") and not server.get("url"):
-                if adapter.server_auto:
-                    # 自动模式下可以不填
-                    pass
-                else:
-                    result.add_error("WebSocket 类型需要 server.host 或 server.url")
+            if not host and not server.get("url") and not adapter.server_auto:
+                errors.append("WebSocket 类型需要 server.host 或 server.url")
 
         # POST 类型通常需要 host 和 port
-        if server_type == "post":
-            if not adapter.server_auto:
-                if not server.get("host"):
-                    result.add_error("POST 类型需要 server.host")
-                if not server.get("port"):
-                    result.add_error("POST 类型需要 server.port")
+        elif server_type == "post" and not adapter.server_auto:
+            if not host:
+                errors.append("POST 类型需要 server.host")
+            if not server.get("port"):
+                errors.append("POST 类型需要 server.port")
 
     # 特殊校验规则
-    _validate_special_rules(account_data, adapter, result)
+    _validate_special_rules(account_data, adapter, model, errors, warnings)
 
-    return result
+    return ValidationResult(valid=not errors, errors=errors, warnings=warnings)
 
 
-def _validate_special_rules(account_data: dict, adapter, result: ValidationResult):
-    """特殊适配器的校验规则"""
+def _rule_telegram(account_data: dict, adapter, model: str, errors: list[str], warnings: list[str]):
+    """Telegram 特殊规则：id 和 access_token 格式"""
+    raw = account_data.get("id", "")
+    id_val = raw if isinstance(raw, str) else str(raw)
+    if ":" not in id_val:
+        warnings.append("Telegram token 格式通常为 id:token")
 
-    # Telegram 特殊规则：id 和 access_token 格式
-    if adapter.key == "telegram":
-        id_val = str(account_data.get("id", ""))
-        if not ":" in id_val:
-            result.add_warning("Telegram token 格式通常为 id:token")
 
-    # QQ 官方频道 V2 intents 检查
-    if adapter.key == "qqguild_v2":
-        model = account_data.get("model_type", "")
-        if "intents" in model:
-            if "extends" not in account_data or "intents" not in account_data.get("extends", {}):
-                result.add_warning("指定 intents 模式需要在 extends 中配置 intents 字段")
+def _rule_qqguild_v2(account_data: dict, adapter, model: str, errors: list[str], warnings: list[str]):
+    """QQ 官方频道 V2 intents 检查"""
+    if "intents" in model:
+        if "extends" not in account_data or "intents" not in account_data.get("extends", {}):
+            warnings.append("指定 intents 模式需要在 extends 中配置 intents 字段")
 
-    # 米游社大别野沙盒模式检查
-    if adapter.key == "mhyvila":
-        model = account_data.get("model_type", "")
-        if model == "sandbox":
-            if "server" not in account_data or not account_data["server"].get("port"):
-                result.add_error("沙盒模式需要填写 server.port (别野号)")
 
-    # B站直播间游客模式提示
-    if adapter.key == "bililive":
-        model = account_data.get("model_type", "")
-        if model == "default":
-            result.add_warning("游客模式只能浏览弹幕，不能发送消息")
+def _rule_mhyvila(account_data: dict, adapter, model: str, errors: list[str], warnings: list[str]):
+    """米游社大别野沙盒模式检查"""
+    if model == "sandbox":
+        server = account_data.get("server")
+        # server 可能是 dict 或 AccountServer 对象
+        if hasattr(server, 'to_dict'):
+            server = server.to_dict()
+        if not server or not server.get("port"):
+            errors.append("沙盒模式需要填写 server.port (别野号)")
+
+
+def _rule_bililive(account_data: dict, adapter, model: str, errors: list[str], warnings: list[str]):
+    """B站直播间游客模式提示"""
+    if model == "default":
+        warnings.append("游客模式只能浏览弹幕，不能发送消息")
+
+
+# 适配器键值 -> 特殊校验规则
+_SPECIAL_RULES = {
+    "telegram": _rule_telegram,
+    "qqguild_v2": _rule_qqguild_v2,
+    "mhyvila": _rule_mhyvila,
+    "bililive": _rule_bililive,
+}
+
+
+def _validate_special_rules(account_data: dict, adapter, model: str, errors: list[str], warnings: list[str]):
+    """特殊适配器的校验规则"""
+    handler = _SPECIAL_RULES.get(adapter.key)
+    if handler is not None:
+        handler(account_data, adapter, model, errors, warnings)
 
 
 def _validate_basic(account_data: dict, result: ValidationResult) -> ValidationResult:
     """基础校验（无适配器配置）"""
+    errors = result.errors
+    warnings = result.warnings
+
     # 检查 server 配置
-    if "server" in account_data and account_data["server"]:
-        server = account_data["server"]
+    server = account_data.get("server")
+    if server:
         # server 可能是 dict 或 AccountServer 对象
         if hasattr(server, 'to_dict'):
             server = server.to_dict()
+        server_type = server.get("type", _MISSING)
 
         # 检查 server.type
-        if "type" not in server:
-            result.add_error("server 缺少 type 字段")
+        if server_type is _MISSING:
+            errors.append("server 缺少 type 字段")
 
         # 检查必要的服务器配置
         if server.get("auto") is False:
             if not server.get("host") and not server.get("url"):
-                result.add_warning("非自动模式建议配置 server.host 或 server.url")
-            if server.get("type") == "post" and not server.get("port"):
-                result.add_warning("POST 类型建议配置 server.port")
+                warnings.append("非自动模式建议配置 server.host 或 server.url")
+            if server_type == "post" and not server.get("port"):
+                warnings.append("POST 类型建议配置 server.port")
 
+    result.valid = not errors
     return result
 
 
+# 扩展字段类型 -> (Python 类型, 类型名称)
+_EXTENDS_TYPES: dict[str, tuple[type, str]] = {
+    "string": (str, "字符串"),
+}
+
+
+@lru_cache(maxsize=64)
+def _extends_schema(adapter_key: str) -> dict[str, tuple[type, str] | None] | None:
+    """将适配器的 extends_options 预编译为 {字段: (Python 类型, 类型名称) | None}
+
+    适配器不存在或未定义扩展字段时返回 None。
+    """
+    adapter = get_adapter_config(adapter_key)
+    if not adapter or not adapter.extends_options:
+        return None
+    return {
+        key: _EXTENDS_TYPES.get(option.get("type"))
+        for key, option in adapter.extends_options.items()
+    }
+
+
 def validate_extends(adapter_key: str, extends: dict) -> ValidationResult:
     """校验扩展字段
 
@@ -195,50 +246,63 @@ def validate_extends(adapter_key: str, extends: dict) -> ValidationResult:
     """
     result = ValidationResult(valid=True)
 
-    adapter = get_adapter_config(adapter_key)
-    if not adapter or not adapter.extends_options:
+    schema = _extends_schema(adapter_key)
+    if schema is None:
         return result
 
+    errors = result.errors
+    warnings = result.warnings
     for key, value in extends.items():
-        if key not in adapter.extends_options:
-            result.add_warning(f"未知的扩展字段: {key}")
-        else:
-            # 检查类型
-            expected_type = adapter.extends_options[key].get("type")
-            if expected_type == "string":
-                if not isinstance(value, str):
-                    result.add_error(f"扩展字段 {key} 应为字符串类型")
-
+        expected = schema.get(key, _MISSING)
+        if expected is _MISSING:
+            warnings.append(f"未知的扩展字段: {key}")
+        # 检查类型
+        elif expected is not None and not isinstance(value, expected[0]):
+            errors.append(f"扩展字段 {key} 应为{expected[1]}类型")
+
+    result.valid = not errors
     return result
 
 
+@lru_cache(maxsize=64)
+def _required_fields_cached(adapter_key: str) -> tuple[str, ...]:
+    adapter = get_adapter_config(adapter_key)
+    return tuple(adapter.required_fields) if adapter else ()
+
+
+@lru_cache(maxsize=64)
+def _optional_fields_cached(adapter_key: str) -> tuple[str, ...]:
+    adapter = get_adapter_config(adapter_key)
+    return tuple(adapter.optional_fields) if adapter else ()
+
+
+@lru_cache(maxsize=64)
+def _model_type_options_cached(adapter_key: str) -> tuple[tuple[str, str], ...]:
+    adapter = get_adapter_config(adapter_key)
+    return tuple(adapter.model_type_options.items()) if adapter else ()
+
+
+@lru_cache(maxsize=64)
+def _extends_options_cached(adapter_key: str) -> tuple[tuple[str, dict], ...]:
+    adapter = get_adapter_config(adapter_key)
+    return tuple(adapter.extends_options.items()) if adapter else ()
+
+
 def get_adapter_required_fields(adapter_key: str) -> list[str]:
     """获取适配器的必填字段列表"""
-    adapter = get_adapter_config(adapter_key)
-    if adapter:
-        return adapter.required_fields.copy()
-    return []
+    return list(_required_fields_cached(adapter_key))
 
 
 def get_adapter_optional_fields(adapter_key: str) -> list[str]:
     """获取适配器的可选字段列表"""
-    adapter = get_adapter_config(adapter_key)
-    if adapter:
-        return adapter.optional_fields.copy()
-    return []
+    return list(_optional_fields_cached(adapter_key))
 
 
 def get_adapter_model_type_options(adapter_key: str) -> dict[str, str]:
     """获取适配器的 model_type 选项"""
-    adapter = get_adapter_config(adapter_key)
-    if adapter:
-        return adapter.model_type_options.copy()
-    return {}
+    return dict(_model_type_options_cached(adapter_key))
 
 
 def get_adapter_extends_options(adapter_key: str) -> dict[str, dict]:
     """获取适配器的扩展字段选项"""
-    adapter = get_adapter_config(adapter_key)
-    if adapter:
-        return adapter.extends_options.copy()
-    return {}
+    return dict(_extends_options_cached(adapter_key))
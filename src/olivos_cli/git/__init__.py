@@ -3,6 +3,9 @@
 Git 操作模块
 """
 
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -12,9 +15,31 @@ from ..core.exceptions import GitError
 from ..core.logger import get_logger
 from ..utils import check_command, run_command, run_command_stream
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 logger = get_logger()
 
 
+def _remove_in_background(target_dir: Path) -> Future:
+    """将已有目录移到同级临时名称后在后台线程删除
+
+    重命名是一次系统调用，目标路径立即可用于克隆，耗时的 rmtree 与克隆并行执行。
+    """
+    trash = target_dir.with_name(f".{target_dir.name}.old-{os.getpid()}")
+    try:
+        os.replace(target_dir, trash)
+    except OSError as e:
+        raise GitError(f"无法删除现有目录: {e}") from e
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(shutil.rmtree, trash)
+    executor.shutdown(wait=False)
+    return future
+
+
 class GitOperator:
     """Git 操作器"""
 
@@ -31,6 +56,66 @@ class GitOperator:
         if not self.check_git():
             raise GitError("git 未安装，请先安装 git")
 
+    def _clone_pygit2(self, url: str, target_dir: Path, branch: str, depth: int) -> bool:
+        """使用 pygit2 (libgit2) 在进程内克隆仓库
+
+        libgit2 不读取 git 的凭据助手等配置，任何失败都返回 False，由调用方回退到 git 命令。
+        """
+        callbacks = None
+        if self.verbose:
+            class _Progress(pygit2.RemoteCallbacks):
+                def transfer_progress(self, stats):
+                    logger.verbose(f"接收对象: {stats.received_objects}/{stats.total_objects}")
+
+            callbacks = _Progress()
+
+        # proxy=True：按 git 配置 (http.proxy) 和 HTTPS_PROXY 等环境变量使用代理
+        kwargs = {"checkout_branch": branch, "callbacks": callbacks, "proxy": True}
+        if depth > 0:
+            kwargs["depth"] = depth
+
+        existed = target_dir.exists()
+        try:
+            pygit2.clone_repository(str(url), str(target_dir), **kwargs)
+        except Exception as e:
+            logger.verbose(f"pygit2 克隆失败，改用 git 命令: {e}")
+            # 清理克隆失败留下的不完整目录
+            if not existed:
+                shutil.rmtree(target_dir, ignore_errors=True)
+            return False
+        return True
+
+    def _run_clone(self, url: str, target_dir: Path, branch: str, depth: int) -> None:
+        """执行克隆"""
+        logger.step(f"正在克隆 {url} 到 {target_dir}")
+
+        # pygit2 可用时对 HTTP(S) 仓库在进程内完成浅克隆，避免启动 git 子进程；
+        # SSH 等地址以及 pygit2 克隆失败时交给 git 处理
+        if pygit2 is not None and depth <= 1 and str(url).startswith(("https://", "http://")):
+            if self._clone_pygit2(url, target_dir, branch, depth):
+                return
+
+        # 构建命令
+        cmd = ["git", "clone", "-b", branch]
+        if depth > 0:
+            cmd.extend(["--depth", str(depth)])
+        cmd.extend([str(url), str(target_dir)])
+
+        # 执行克隆
+        if self.verbose:
+            # 使用流式输出
+            returncode = run_command_stream(
+                cmd,
+                line_callback=lambda line: logger.verbose(line),
+                error_callback=lambda line: logger.verbose(line),
+            )
+            if returncode != 0:
+                raise GitError(f"克隆失败，返回码: {returncode}")
+        else:
+            result = run_command(cmd, check=False)
+            if result.returncode != 0:
+                raise GitError(f"克隆失败: {result.stderr}")
+
     def clone(
         self,
         repo_url: str,
@@ -61,39 +146,21 @@ class GitOperator:
         url = mirror_url if use_mirror and mirror_url else repo_url
 
         # 检查目标目录
+        removal = None
         if target_dir.exists():
             if not force:
                 logger.warning_print(f"目标目录已存在: {target_dir}")
                 return False
-            import shutil
-
-            try:
-                shutil.rmtree(target_dir)
-            except Exception as e:
-                raise GitError(f"无法删除现有目录: {e}") from e
+            removal = _remove_in_background(target_dir)
 
-        # 构建命令
-        cmd = ["git", "clone", "-b", branch]
-        if depth > 0:
-            cmd.extend(["--depth", str(depth)])
-        cmd.extend([str(url), str(target_dir)])
-
-        # 执行克隆
-        logger.step(f"正在克隆 {url} 到 {target_dir}")
-
-        if self.verbose:
-            # 使用流式输出
-            returncode = run_command_stream(
-                cmd,
-                line_callback=lambda line: logger.verbose(line),
-                error_callback=lambda line: logger.verbose(line),
-            )
-            if returncode != 0:
-                raise GitError(f"克隆失败，返回码: {returncode}")
-        else:
-            result = run_command(cmd, check=False)
-            if result.returncode != 0:
-                raise GitError(f"克隆失败: {result.stderr}")
+        try:
+            self._run_clone(url, target_dir, branch, depth)
+        finally:
+            if removal is not None:
+                try:
+                    removal.result()
+                except Exception as e:
+                    logger.warning_print(f"清理旧目录失败: {e}")
 
         logger.success(f"克隆成功: {target_dir}")
         return True
@@ -216,6 +283,46 @@ class GitOperator:
 
         return result.stdout.strip()
 
+    def _status_v2(self, repo_dir: Path) -> Optional[dict]:
+        """通过一次 `git status --porcelain=v2 --branch` 获取仓库状态
+
+        git 不支持 v2 格式或执行失败时返回 None。
+        """
+        cmd = ["git", "status", "--porcelain=v2", "--branch", "--untracked-files=normal"]
+        result = run_command(cmd, cwd=str(repo_dir), capture=True)
+        if result.returncode != 0:
+            return None
+
+        branch = ""
+        commit = ""
+        ahead = 0
+        dirty = False
+        for line in result.stdout.splitlines():
+            if not line.startswith("#"):
+                if line:
+                    dirty = True
+                continue
+            _, _, rest = line.partition(" ")
+            key, _, value = rest.partition(" ")
+            if key == "branch.head":
+                branch = "" if value == "(detached)" else value
+            elif key == "branch.oid":
+                commit = value
+            elif key == "branch.ab":
+                ahead = int(value.split()[0])
+
+        # 尚无任何提交，与 `git rev-parse HEAD` 失败时的行为保持一致
+        if commit == "(initial)":
+            raise GitError("获取 commit 失败: 仓库尚无提交")
+
+        return {
+            "exists": True,
+            "branch": branch,
+            "commit": commit,
+            "dirty": dirty,
+            "ahead": ahead > 0,
+        }
+
     def get_repo_status(self, repo_dir: Path) -> dict:
         """获取仓库状态"""
         self.ensure_git()
@@ -224,6 +331,11 @@ class GitOperator:
             return {"exists": False}
 
         try:
+            status = self._status_v2(repo_dir)
+            if status is not None:
+                return status
+
+            # 旧版本 git 不支持 porcelain v2，逐项查询
             branch = self.get_current_branch(repo_dir)
             commit = self.get_current_commit(repo_dir)
 
@@ -28,9 +28,18 @@ class Account:
 
     def to_dict(self) -> dict:
         """转换为字典"""
-        from dataclasses import asdict
-
-        return asdict(self)
+        return {
+            "id": self.id,
+            "password": self.password,
+            "sdk_type": self.sdk_type,
+            "platform_type": self.platform_type,
+            "model_type": self.model_type,
+            # extends 按引用返回，不做深拷贝
+            "extends": self.extends,
+            "debug": self.debug,
+            # server 可能在构造后被直接赋值为 dict
+            "server": self.server.to_dict() if isinstance(self.server, AccountServer) else self.server,
+        }
 
 
 @dataclass
@@ -46,9 +55,14 @@ class AccountServer:
 
     def to_dict(self) -> dict:
         """转换���字典"""
-        from dataclasses import asdict
-
-        return asdict(self)
+        return {
+            "auto": self.auto,
+            "type": self.type,
+            "host": self.host,
+            "port": self.port,
+            "access_token": self.access_token,
+            "url": self.url,
+        }
 
 
 @dataclass
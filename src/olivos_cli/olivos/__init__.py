@@ -3,7 +3,10 @@
 OlivOS 配置交互模块
 """
 
+import copy
 import json
+import os
+import stat
 from pathlib import Path
 from typing import Any, Optional
 
@@ -12,8 +15,83 @@ from ..core.exceptions import OlivOSConfigError
 from ..core.logger import get_logger
 from ..models import Account
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = get_logger()
 
+# account.json 超过该大小且 ijson 可用时，逐条流式解析账号
+_STREAM_THRESHOLD = 64 * 1024
+
+
+def _load_json(path: Path) -> Any:
+    """读取 JSON 文件，可用时使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(path: Path, data: Any) -> None:
+    """写入 JSON 文件（2 空格缩进，不转义非 ASCII），可用时使用 orjson
+
+    先写入同目录下的临时文件并 fsync，再通过 os.replace 原子替换目标文件，
+    避免写入中途中断导致配置损坏。目标为符号链接时写入其指向的文件，
+    已存在的文件保留原有权限（account.json 中含有密码和 token）。
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    path = path.resolve()
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    tmp = path.with_name(path.name + ".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        # 覆盖已有文件时先以 0600 创建，写完后再设为原文件的权限
+        fd = os.open(tmp, flags, 0o600 if mode is not None else 0o666)
+        with open(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _account_from_dict(acc_data: dict) -> Account:
+    """由 account.json 中的单条记录构造 Account"""
+    return Account(
+        id=acc_data.get("id", ""),
+        password=acc_data.get("password", ""),
+        sdk_type=acc_data.get("sdk_type", ""),
+        platform_type=acc_data.get("platform_type", ""),
+        model_type=acc_data.get("model_type", "default"),
+        extends=acc_data.get("extends", {}),
+        debug=acc_data.get("debug", False),
+        server=acc_data.get("server", {}),
+    )
+
+
+def _account_key(account: Account) -> tuple[str, str, str, str]:
+    """账号唯一键：(id, platform_type, sdk_type, model_type)"""
+    return (str(account.id), account.platform_type, account.sdk_type, account.model_type)
+
 
 class OlivOSConfigManager:
     """OlivOS 配置管理器"""
@@ -34,8 +112,7 @@ class OlivOSConfigManager:
         if not self.basic_file.exists():
             return {}
         try:
-            with open(self.basic_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json(self.basic_file)
         except Exception as e:
             raise OlivOSConfigError(f"读取 basic.json 失败: {e}") from e
 
@@ -43,8 +120,7 @@ class OlivOSConfigManager:
         """写入 basic.json"""
         self.ensure_dirs()
         try:
-            with open(self.basic_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(self.basic_file, data)
         except Exception as e:
             raise OlivOSConfigError(f"写入 basic.json 失败: {e}") from e
 
@@ -53,8 +129,7 @@ class OlivOSConfigManager:
         if not self.config_file.exists():
             return {}
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json(self.config_file)
         except Exception as e:
             raise OlivOSConfigError(f"读取 config.json 失败: {e}") from e
 
@@ -62,35 +137,13 @@ class OlivOSConfigManager:
         """写入 config.json"""
         self.ensure_dirs()
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(self.config_file, data)
         except Exception as e:
             raise OlivOSConfigError(f"写入 config.json 失败: {e}") from e
 
     def read_accounts(self) -> list[Account]:
         """读取账号列表"""
-        if not self.account_file.exists():
-            return []
-
-        try:
-            with open(self.account_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            accounts = []
-            for acc_data in data.get("account", []):
-                accounts.append(Account(
-                    id=acc_data.get("id", ""),
-                    password=acc_data.get("password", ""),
-                    sdk_type=acc_data.get("sdk_type", ""),
-                    platform_type=acc_data.get("platform_type", ""),
-                    model_type=acc_data.get("model_type", "default"),
-                    extends=acc_data.get("extends", {}),
-                    debug=acc_data.get("debug", False),
-                    server=acc_data.get("server", {}),
-                ))
-            return accounts
-        except Exception as e:
-            raise OlivOSConfigError(f"读取账号配置失败: {e}") from e
+        return [_account_from_dict(acc_data) for acc_data in self._read_raw_accounts()]
 
     def write_accounts(self, accounts: list[Account]) -> None:
         """写入账号列表"""
@@ -100,24 +153,48 @@ class OlivOSConfigManager:
             data = {
                 "account": [acc.to_dict() for acc in accounts]
             }
-            with open(self.account_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(self.account_file, data)
+        except Exception as e:
+            raise OlivOSConfigError(f"写入账号配置失败: {e}") from e
+
+    def _read_raw_accounts(self) -> list[dict]:
+        """读取 account.json 中未经转换的账号记录
+
+        文件较大且 ijson 可用时逐条流式解析。
+        """
+        try:
+            size = self.account_file.stat().st_size
+        except FileNotFoundError:
+            return []
+
+        try:
+            if ijson is not None and size > _STREAM_THRESHOLD:
+                with open(self.account_file, "rb") as f:
+                    return list(ijson.items(f, "account.item", use_float=True))
+            return _load_json(self.account_file).get("account", [])
+        except Exception as e:
+            raise OlivOSConfigError(f"读取账号配置失败: {e}") from e
+
+    def _write_raw_accounts(self, raw_accounts: list[dict]) -> None:
+        """直接写入账号记录，不经过 Account 转换"""
+        self.ensure_dirs()
+
+        try:
+            _dump_json(self.account_file, {"account": raw_accounts})
         except Exception as e:
             raise OlivOSConfigError(f"写入账号配置失败: {e}") from e
 
     def add_account(self, account: Account) -> None:
         """添加账号"""
         accounts = self.read_accounts()
+        keys = {_account_key(acc) for acc in accounts}
 
         # 检查是否已存在（同一适配器下：platform + sdk + model 相同）
-        for existing in accounts:
-            if (str(existing.id) == str(account.id) and
-                existing.platform_type == account.platform_type and
-                existing.sdk_type == account.sdk_type and
-                existing.model_type == account.model_type):
-                raise OlivOSConfigError(
-                    f"账号已存在: {account.id} (适配器: {account.platform_type}/{account.sdk_type}/{account.model_type})"
-                )
+        key = _account_key(account)
+        if key in keys:
+            raise OlivOSConfigError(
+                f"账号已存在: {account.id} (适配器: {account.platform_type}/{account.sdk_type}/{account.model_type})"
+            )
 
         accounts.append(account)
         self.write_accounts(accounts)
@@ -146,9 +223,15 @@ class OlivOSConfigManager:
 
         for acc in accounts:
             if str(acc.id) == str(account_id):
+                # acc 由 read_accounts 从文件新构造，其快照即文件中的内容；
+                # 深拷贝快照，使其不与 acc 共享 extends 等嵌套对象
+                before = copy.deepcopy(acc.to_dict())
                 for key, value in kwargs.items():
                     if hasattr(acc, key):
                         setattr(acc, key, value)
+                if acc.to_dict() == before:
+                    # 没有字段发生变化，无需写回
+                    return True
                 self.write_accounts(accounts)
                 logger.success(f"账号已更新: {account_id}")
                 return True
@@ -177,12 +260,20 @@ class OlivOSConfigManager:
             return []
 
         sdk_type = SUPPORTED_ADAPTERS[adapter_type]["sdk_type"]
-        accounts = self.read_accounts()
-        return [acc for acc in accounts if acc.sdk_type == sdk_type]
+        return [
+            _account_from_dict(acc_data) for acc_data in self._read_raw_accounts()
+            if acc_data.get("sdk_type", "") == sdk_type
+        ]
 
     def count_accounts_by_adapter(self, adapter_type: str) -> int:
         """按适配器类型统计账号数量"""
-        return len(self.list_accounts_by_adapter(adapter_type))
+        from ..core.const import SUPPORTED_ADAPTERS
+
+        if adapter_type not in SUPPORTED_ADAPTERS:
+            return 0
+
+        sdk_type = SUPPORTED_ADAPTERS[adapter_type]["sdk_type"]
+        return sum(1 for acc_data in self._read_raw_accounts() if acc_data.get("sdk_type", "") == sdk_type)
 
     def remove_accounts_by_adapter(self, adapter_type: str) -> int:
         """删除指定适配器类型的所有账号，返回删除数量"""
@@ -192,14 +283,12 @@ class OlivOSConfigManager:
             return 0
 
         sdk_type = SUPPORTED_ADAPTERS[adapter_type]["sdk_type"]
-        accounts = self.read_accounts()
-
-        original_count = len(accounts)
-        accounts = [acc for acc in accounts if acc.sdk_type != sdk_type]
+        raw_accounts = self._read_raw_accounts()
+        kept = [acc_data for acc_data in raw_accounts if acc_data.get("sdk_type", "") != sdk_type]
 
-        removed_count = original_count - len(accounts)
+        removed_count = len(raw_accounts) - len(kept)
         if removed_count > 0:
-            self.write_accounts(accounts)
+            self._write_raw_accounts(kept)
 
         return removed_count
 
@@ -6,15 +6,56 @@ OlivOS 账号类型配置读取模块
 """
 
 import ast
+import hashlib
+import json
+import mmap
+import os
+import pickle
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ..core.const import CACHE_DIR
 from ..core.logger import get_logger
 
 logger = get_logger()
 
+# Python 字面量转 JSON 时需要处理的记号：字符串、注释、True/False/None、尾随逗号。
+# 字符串排在最前，保证其内部的内容不会被后面的规则误改
+_PY_LITERAL_TOKEN = re.compile(
+    r"""'((?:[^'\\\n]|\\.)*)'|"((?:[^"\\\n]|\\.)*)"|#[^\n]*|\b(True|False|None)\b|,(\s*[}\]])"""
+)
+_JSON_CONSTANTS = {"True": "true", "False": "false", "None": "null"}
+
+
+def _to_json_token(match: re.Match) -> str:
+    single, double, const, closing = match.groups()
+    text = single if single is not None else double
+    if text is not None:
+        if "\\" in text:
+            # Python 与 JSON 的转义规则不同，交给 ast 处理
+            raise ValueError("escape sequence")
+        return '"' + text.replace('"', '\\"') + '"'
+    if const is not None:
+        return _JSON_CONSTANTS[const]
+    if closing is not None:
+        return closing
+    return ""  # 注释
+
+
+def _parse_literal(text: str) -> Any:
+    """解析 Python 字面量
+
+    先转换为 JSON 用 json.loads 解析（远快于 ast.literal_eval），
+    遇到无法转换的写法（转义、元组等）时回退到 ast.literal_eval。
+    """
+    try:
+        return json.loads(_PY_LITERAL_TOKEN.sub(_to_json_token, text))
+    except ValueError:
+        return ast.literal_eval(text)
+
 
 @dataclass
 class AccountTypeConfig:
@@ -38,6 +79,232 @@ class AdapterTypeInfo:
     available_models: list[str]  # 可用的 model 类型
 
 
+# 平台显示名称
+_PLATFORM_NAMES = {
+    "qq": "QQ",
+    "wechat": "微信",
+    "qqGuild": "QQ频道",
+    "kaiheila": "KOOK",
+    "xiaoheihe": "小黑盒",
+    "mhyVila": "米游社大别野",
+    "telegram": "Telegram",
+    "dodo": "Dodo",
+    "fanbook": "Fanbook",
+    "discord": "Discord",
+    "terminal": "虚拟终端",
+    "hackChat": "Hack.Chat",
+    "biliLive": "B站直播间",
+    "dingtalk": "钉钉",
+}
+
+# model 显示名称
+_MODEL_NAMES = {
+    "default": "默认",
+    "public": "公域",
+    "private": "私域",
+    "sandbox": "沙盒",
+    "login": "登录",
+    "postapi": "接口终端",
+    "ff14": "FF14终端",
+}
+
+# 需要提取的变量 -> 定位其字面量起始括号的正则（直接匹配文件字节）
+_REGION_MARKERS = (
+    ("accountTypeMappingList", re.compile(rb"\baccountTypeMappingList\s*=\s*(\{)")),
+    ("accountTypeDataList_platform_sdk_model", re.compile(rb"\baccountTypeDataList_platform_sdk_model\s*=\s*(\{)")),
+    ("accountTypeDataList_platform", re.compile(rb"\baccountTypeDataList_platform\s*=\s*(\[)")),
+)
+_BRACKET_RES = {
+    b"{": re.compile(rb"[{}]"),
+    b"[": re.compile(rb"[\[\]]"),
+}
+
+
+def _extract_regions(content: bytes | mmap.mmap) -> dict[str, str | None]:
+    """一次遍历提取 accountMetadataAPI.py 中各变量的字面量文本
+
+    各变量按出现位置依次匹配括号，只跳跃扫描括号字符，整个文件至多遍历一次；
+    只解码匹配到的片段。未找到的变量对应 None。
+    """
+    regions: dict[str, str | None] = {}
+    starts = []
+    for name, marker_re in _REGION_MARKERS:
+        regions[name] = None
+        m = marker_re.search(content)
+        if m is not None:
+            starts.append((m.start(1), name, m.group(1)))
+
+    for open_idx, name, opener in sorted(starts):
+        depth = 0
+        end_idx = open_idx
+        for m in _BRACKET_RES[opener].finditer(content, open_idx):
+            if m.group() == opener:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end_idx = m.end()
+                    break
+        regions[name] = content[open_idx:end_idx].decode("utf-8")
+
+    return regions
+
+
+def _parse_account_type_mapping(literal: str | None) -> dict[str, AccountTypeConfig]:
+    """解析 accountTypeMappingList"""
+    if literal is None:
+        logger.warning_print("未找到 accountTypeMappingList")
+        return {}
+
+    # 安全解析字面量
+    try:
+        mapping_dict = _parse_literal(literal)
+
+        result = {}
+        for name, config in mapping_dict.items():
+            result[name] = AccountTypeConfig(
+                name=name,
+                platform=config[0],
+                sdk=config[1],
+                model=config[2],
+                server_auto=str(config[3]).lower() == "true",
+                server_type=config[4],
+            )
+
+        return result
+    except Exception as e:
+        logger.warning_print(f"解析 accountTypeMappingList 失败: {e}")
+        return {}
+
+
+def _parse_adapter_types(literal: str | None) -> dict[str, dict[str, list[str]]]:
+    """解析适配器类型信息（返回 platform: {sdk: [models]}）"""
+    if literal is None:
+        logger.warning_print("未找到 accountTypeDataList_platform_sdk_model")
+        return {}
+
+    try:
+        return _parse_literal(literal)
+    except Exception as e:
+        logger.warning_print(f"解析 accountTypeDataList_platform_sdk_model 失败: {e}")
+        return {}
+
+
+def _parse_platform_list(literal: str | None) -> list[str]:
+    """解析 accountTypeDataList_platform"""
+    if literal is None:
+        logger.warning_print("未找到 accountTypeDataList_platform")
+        return []
+
+    try:
+        return _parse_literal(literal)
+    except Exception as e:
+        logger.warning_print(f"解析 accountTypeDataList_platform 失败: {e}")
+        return []
+
+
+def _adapter_name(platform: str, model: str) -> str:
+    """获取适配器显示名称"""
+    platform_name = _PLATFORM_NAMES.get(platform, platform)
+    if model == "default":
+        return platform_name
+    return f"{platform_name} ({_MODEL_NAMES.get(model, model)})"
+
+
+def _flatten_adapter_types(
+    platform_sdk_model: dict[str, dict[str, list[str]]],
+) -> tuple[AdapterTypeInfo, ...]:
+    """将平台-SDK-模型映射展开为 AdapterTypeInfo 元组"""
+    return tuple(
+        AdapterTypeInfo(
+            name=_adapter_name(platform, "default"),
+            platform=platform,
+            sdk=sdk,
+            available_models=models,
+        )
+        for platform, sdks in platform_sdk_model.items()
+        for sdk, models in sdks.items()
+    )
+
+
+# 解析结果的磁盘缓存目录；解析逻辑或数据结构变化时递增版本号使旧缓存失效
+_META_CACHE_DIR = CACHE_DIR / "account_meta"
+_META_CACHE_VERSION = 2
+
+
+def _parse_metadata(
+    path_str: str,
+) -> tuple[
+    dict[str, AccountTypeConfig],
+    dict[str, dict[str, list[str]]],
+    list[str],
+    tuple[AdapterTypeInfo, ...],
+]:
+    """读取并解析 accountMetadataAPI.py
+
+    通过 mmap 直接在文件字节上匹配，只有用到的页会被读入，也无需解码整个文件。
+    """
+    with open(path_str, "rb") as f:
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # 空文件等无法映射的情况
+            content = f.read()
+        try:
+            regions = _extract_regions(content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    platform_sdk_model = _parse_adapter_types(regions["accountTypeDataList_platform_sdk_model"])
+    return (
+        _parse_account_type_mapping(regions["accountTypeMappingList"]),
+        platform_sdk_model,
+        _parse_platform_list(regions["accountTypeDataList_platform"]),
+        _flatten_adapter_types(platform_sdk_model),
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_metadata(
+    path_str: str, mtime_ns: int
+) -> tuple[
+    dict[str, AccountTypeConfig],
+    dict[str, dict[str, list[str]]],
+    list[str],
+    tuple[AdapterTypeInfo, ...],
+]:
+    """获取解析后的元数据，进程内按 (路径, mtime) 缓存
+
+    跨进程时优先读取 CACHE_DIR 下以路径摘要与 mtime 命名的 pickle 缓存，
+    缓存缺失或损坏时重新解析并写入，同时清理该路径的旧缓存。
+
+    Returns:
+        (账号类型映射, 平台-SDK-模型映射, 平台列表, 适配器类型)
+    """
+    digest = hashlib.sha1(path_str.encode("utf-8")).hexdigest()[:16]
+    prefix = f"v{_META_CACHE_VERSION}_{digest}_"
+    cache_file = _META_CACHE_DIR / f"{prefix}{mtime_ns}.pkl"
+
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except Exception:
+        pass
+
+    result = _parse_metadata(path_str)
+
+    try:
+        _META_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _META_CACHE_DIR.glob(f"v*_{digest}_*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp = cache_file.with_name(cache_file.name + ".tmp")
+        tmp.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"写入账号元数据缓存失败: {e}")
+
+    return result
+
+
 class OlivOSAccountAPI:
     """OlivOS 账号 API 读取器"""
 
@@ -55,162 +322,38 @@ class OlivOSAccountAPI:
                 break
         else:
             self.account_api_file = olivos_path / "OlivOS" / "core" / "core" / "accountMetadataAPI.py"
-        self._account_type_mapping: dict[str, AccountTypeConfig] | None = None
-        self._adapter_types: dict[str, dict[str, list[str]]] | None = None
-
-    def _read_file(self) -> str:
-        """读取 accountMetadataAPI.py 文件"""
-        if not self.account_api_file.exists():
-            raise FileNotFoundError(f"OlivOS accountMetadataAPI.py 不存在: {self.account_api_file}")
-
-        with open(self.account_api_file, "r", encoding="utf-8") as f:
-            return f.read()
-
-    def _parse_account_type_mapping(self, content: str) -> dict[str, AccountTypeConfig]:
-        """解析 accountTypeMappingList"""
-        if self._account_type_mapping is not None:
-            return self._account_type_mapping
-
-        # 找到 accountTypeMappingList = { 的位置
-        start_marker = "accountTypeMappingList = {"
-        start_idx = content.find(start_marker)
-        if start_idx == -1:
-            logger.warning_print("未找到 accountTypeMappingList")
-            return {}
-
-        # 从起始位置开始，手动匹配花括号
-        brace_count = 0
-        in_dict = False
-        end_idx = start_idx + len(start_marker) - 1  # 包含起始的 {
-
-        for i in range(start_idx + len(start_marker) - 1, len(content)):
-            if content[i] == '{':
-                brace_count += 1
-                in_dict = True
-            elif content[i] == '}':
-                brace_count -= 1
-                if in_dict and brace_count == 0:
-                    end_idx = i + 1
-                    break
-
-        dict_content = content[start_idx + len("accountTypeMappingList"):end_idx].strip()
-        if not dict_content.startswith('='):
-            logger.warning_print("accountTypeMappingList 格式错误")
-            return {}
-        dict_content = dict_content[1:].strip()  # 移除 '='
-
-        # 使用 ast 安全解析
-        try:
-            tree = ast.parse(dict_content, mode="eval")
-            mapping_dict = ast.literal_eval(tree)
-
-            result = {}
-            for name, config in mapping_dict.items():
-                result[name] = AccountTypeConfig(
-                    name=name,
-                    platform=config[0],
-                    sdk=config[1],
-                    model=config[2],
-                    server_auto=str(config[3]).lower() == "true",
-                    server_type=config[4],
-                )
-
-            self._account_type_mapping = result
-            return result
-
-        except Exception as e:
-            logger.warning_print(f"解析 accountTypeMappingList 失败: {e}")
-            return {}
-
-    def _parse_adapter_types(self, content: str) -> dict[str, dict[str, list[str]]]:
-        """解析适配器类型信息（返回 platform: {sdk: [models]}）"""
-        if self._adapter_types is not None:
-            return self._adapter_types
-
-        # 提取 accountTypeDataList_platform_sdk_model
-        start_marker = "accountTypeDataList_platform_sdk_model = {"
-        start_idx = content.find(start_marker)
-        if start_idx == -1:
-            logger.warning_print("未找到 accountTypeDataList_platform_sdk_model")
-            return {}
-
-        brace_count = 0
-        in_dict = False
-        end_idx = start_idx + len(start_marker) - 1
-
-        for i in range(start_idx + len(start_marker) - 1, len(content)):
-            if content[i] == '{':
-                brace_count += 1
-                in_dict = True
-            elif content[i] == '}':
-                brace_count -= 1
-                if in_dict and brace_count == 0:
-                    end_idx = i + 1
-                    break
-
-        dict_content = content[start_idx + len("accountTypeDataList_platform_sdk_model"):end_idx].strip()
-        if not dict_content.startswith('='):
-            logger.warning_print("accountTypeDataList_platform_sdk_model 格式错误")
-            return {}
-        dict_content = dict_content[1:].strip()  # 移除 '='
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """清空进程内及磁盘上的元数据缓存"""
+        _load_metadata.cache_clear()
+        for cache_file in _META_CACHE_DIR.glob("*.pkl"):
+            cache_file.unlink(missing_ok=True)
+
+    def _metadata(self) -> tuple[
+        dict[str, AccountTypeConfig],
+        dict[str, dict[str, list[str]]],
+        list[str],
+        tuple[AdapterTypeInfo, ...],
+    ]:
+        """获取解析后的元数据（文件未变化时直接返回缓存结果）"""
         try:
-            tree = ast.parse(dict_content, mode="eval")
-            platform_sdk_model = ast.literal_eval(tree)
-
-            self._adapter_types = platform_sdk_model
-            return platform_sdk_model
-
-        except Exception as e:
-            logger.warning_print(f"解析 accountTypeDataList_platform_sdk_model 失败: {e}")
-            return {}
+            mtime = self.account_api_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"OlivOS accountMetadataAPI.py 不存在: {self.account_api_file}") from None
+        return _load_metadata(str(self.account_api_file), mtime)
 
     def _get_adapter_name(self, platform: str, sdk: str, model: str) -> str:
         """获取适配器显示名称"""
-        # 映射表
-        platform_names = {
-            "qq": "QQ",
-            "wechat": "微信",
-            "qqGuild": "QQ频道",
-            "kaiheila": "KOOK",
-            "xiaoheihe": "小黑盒",
-            "mhyVila": "米游社大别野",
-            "telegram": "Telegram",
-            "dodo": "Dodo",
-            "fanbook": "Fanbook",
-            "discord": "Discord",
-            "terminal": "虚拟终端",
-            "hackChat": "Hack.Chat",
-            "biliLive": "B站直播间",
-            "dingtalk": "钉钉",
-        }
-
-        model_names = {
-            "default": "默认",
-            "public": "公域",
-            "private": "私域",
-            "sandbox": "沙盒",
-            "login": "登录",
-            "postapi": "接口终端",
-            "ff14": "FF14终端",
-        }
-
-        platform_name = platform_names.get(platform, platform)
-        model_name = model_names.get(model, model)
-
-        if model == "default":
-            return platform_name
-        return f"{platform_name} ({model_name})"
+        return _adapter_name(platform, model)
 
     def get_account_types(self) -> dict[str, AccountTypeConfig]:
         """获取所有账号类型配置"""
-        content = self._read_file()
-        return self._parse_account_type_mapping(content)
+        return self._metadata()[0]
 
-    def get_adapter_types(self) -> dict[str, list[AdapterTypeInfo]]:
-        """获取适配器类型（按平台分组）"""
-        content = self._read_file()
-        return self._parse_adapter_types(content)
+    def get_adapter_types(self) -> tuple[AdapterTypeInfo, ...]:
+        """获取所有适配器类型（每个平台-SDK 组合一项）"""
+        return self._metadata()[3]
 
     def get_predefined_templates(self, platform: str | None = None) -> list[AccountTypeConfig]:
         """获取预定义的账号类型模板
@@ -225,49 +368,11 @@ class OlivOSAccountAPI:
 
     def get_platform_list(self) -> list[str]:
         """获取平台列表"""
-        content = self._read_file()
-
-        # 提取 accountTypeDataList_platform
-        start_marker = "accountTypeDataList_platform = ["
-        start_idx = content.find(start_marker)
-        if start_idx == -1:
-            logger.warning_print("未找到 accountTypeDataList_platform")
-            return []
-
-        # 找到列表结束位置（使用方括号匹配）
-        bracket_count = 0
-        in_list = False
-        end_idx = start_idx + len(start_marker) - 1  # 包含起始的 [
-
-        for i in range(start_idx + len(start_marker) - 1, len(content)):
-            if content[i] == '[':
-                bracket_count += 1
-                in_list = True
-            elif content[i] == ']':
-                bracket_count -= 1
-                if in_list and bracket_count == 0:
-                    end_idx = i + 1
-                    break
-
-        # 提取列表内容
-        list_content = content[start_idx + len("accountTypeDataList_platform"):end_idx].strip()
-        if not list_content.startswith('='):
-            logger.warning_print("accountTypeDataList_platform 格式错误")
-            return []
-        list_content = list_content[1:].strip()  # 移除 '='
-
-        try:
-            tree = ast.parse(list_content, mode="eval")
-            platform_list = ast.literal_eval(tree)
-            return platform_list
-        except Exception as e:
-            logger.warning_print(f"解析 accountTypeDataList_platform 失败: {e}")
-            return []
+        return self._metadata()[2]
 
     def get_platform_sdk_model(self) -> dict:
         """获取平台-SDK-模型的映射关系"""
-        content = self._read_file()
-        return self._parse_adapter_types(content)
+        return self._metadata()[1]
 
 
 def get_account_api(olivos_path: Path) -> OlivOSAccountAPI:
@@ -1,28 +1,41 @@
 # -*- coding: utf-8 -*-
 """
-包管理器基类
+包管理器接口
 """
 
-from abc import ABC, abstractmethod
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Protocol
 
+# 虚拟环境内 Python 解释器的相对路径
+_VENV_PY_REL = Path("Scripts", "python.exe") if sys.platform == "win32" else Path("bin", "python")
 
-class PackageManager(ABC):
-    """包管理器基类"""
 
-    name: str = "base"
+@lru_cache(maxsize=16)
+def _venv_python_for(target_dir_str: str, venv_dir: str) -> Optional[Path]:
+    """检测目标目录的虚拟环境 Python（按目录缓存，新建虚拟环境后需 cache_clear）"""
+    venv_path = Path(target_dir_str) / venv_dir
+    if not venv_path.exists():
+        return None
+
+    python_bin = venv_path / _VENV_PY_REL
+    return python_bin if python_bin.exists() else None
+
+
+class PackageManager(Protocol):
+    """包管理器接口（结构化类型，具体实现无需继承）"""
+
+    name: str
 
-    @abstractmethod
     def is_available(self) -> bool:
         """检查包管理器是否可用"""
-        pass
+        ...
 
-    @abstractmethod
     def install(self, target_dir: Path, requirements: Path) -> bool:
         """安装依赖"""
-        pass
+        ...
 
-    @abstractmethod
     def install_venv(self, target_dir: Path, venv_path: Path, requirements: Path) -> bool:
         """在虚拟环境中安装依赖
 
@@ -31,24 +44,28 @@ class PackageManager(ABC):
             venv_path: 虚拟环境路径
             requirements: 依赖文件路径
         """
-        pass
+        ...
 
-    @abstractmethod
     def add(self, package: str, target_dir: Path) -> bool:
         """添加包"""
-        pass
+        ...
+
+    def add_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中添加多个包"""
+        ...
 
-    @abstractmethod
     def remove(self, package: str, target_dir: Path) -> bool:
         """移除包"""
-        pass
+        ...
+
+    def remove_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中移除多个包"""
+        ...
 
-    @abstractmethod
     def update(self, target_dir: Path) -> bool:
         """更新依赖"""
-        pass
+        ...
 
-    @abstractmethod
     def list_installed(self, target_dir: Path) -> list[str]:
         """列出已安装的包"""
-        pass
+        ...
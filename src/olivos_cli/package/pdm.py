@@ -3,15 +3,17 @@
 PDM 包管理器实现
 """
 
-import subprocess
+import os
 import sys
-from collections import deque
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
 
 from ..core.exceptions import PackageError
 from ..core.logger import get_logger
-from ..utils import run_command, run_command_stream
-from .base import PackageManager
+from ..utils import check_command, run_command, run_with_tail_output
+from .base import _VENV_PY_REL
 
 logger = get_logger()
 
@@ -19,24 +21,34 @@ logger = get_logger()
 MAX_OUTPUT_LINES = 4
 
 
-class PDMPackageManager(PackageManager):
+class PDMPackageManager:
     """PDM 包管理器"""
 
     name = "pdm"
     VENV_DIR = ".venv"
+    # 进程内缓存的 PDM 可用性检测结果
+    _pdm_available: Optional[bool] = None
 
     def __init__(self, auto_install: bool = True, index_url: str = None, verbose: bool = False):
         self.auto_install = auto_install
         self.index_url = index_url
         self.verbose = verbose
+        # PDM 的镜像源通过环境变量设置
+        self._env_overrides = {"PDM_INDEX_URL": index_url} if index_url else {}
+
+    @cached_property
+    def _env(self) -> Optional[dict[str, str]]:
+        """子进程环境变量，无需覆盖时为 None（直接继承当前环境）"""
+        if not self._env_overrides:
+            return None
+        return {**os.environ, **self._env_overrides}
 
     def is_available(self) -> bool:
-        """检查 PDM 是否可用"""
-        try:
-            result = run_command(["pdm", "--version"], capture=True, check=False)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """检查 PDM 是否可用（结果在进程内缓存）"""
+        cls = type(self)
+        if cls._pdm_available is None:
+            cls._pdm_available = check_command("pdm")
+        return cls._pdm_available
 
     def ensure_available(self) -> None:
         """确保 PDM 可用"""
@@ -48,115 +60,18 @@ class PDMPackageManager(PackageManager):
                 result = run_command(install_cmd, check=False)
                 if result.returncode != 0:
                     raise PackageError("PDM 安装失败")
+                type(self)._pdm_available = True
                 logger.success("PDM 安装成功")
             else:
                 raise PackageError("PDM 不可用，请使用以下命令安装: pip install pdm")
 
-    def _detect_venv_python(self, target_dir: Path) -> Path:
-        """检测目标目录的虚拟环境 Python"""
-        venv_path = target_dir / self.VENV_DIR
-        if not venv_path.exists():
-            return None
-
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
-
-        return python_bin if python_bin.exists() else None
-
     def _get_pdm_command(self, target_dir: Path = None) -> list[str]:
-        """获取 pdm 命令"""
-        cmd = ["pdm"]
-
-        # 如果有虚拟环境，设置 PDM_PYTHON 环境变量
-        if target_dir:
-            venv_python = self._detect_venv_python(target_dir)
-            if venv_python:
-                # 使用虚拟环境的 Python
-                return cmd
-
-        return cmd
-
-    def _run_with_limited_output(self, cmd: list[str], cwd: str) -> int:
-        """运行命令，只显示最后几行输出
-
-        Args:
-            cmd: 命令列表
-            cwd: 工作目录
-
-        Returns:
-            返回码
-        """
-        process = subprocess.Popen(
-            cmd,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-
-        # 使用 deque 保存最后几行
-        output_buffer = deque(maxlen=MAX_OUTPUT_LINES)
-
-        for line in process.stdout:
-            line = line.strip()
-            if line:
-                output_buffer.append(line)
-
-        returncode = process.wait()
+        """获取 pdm 命令
 
-        # 打印最后几行
-        for output_line in output_buffer:
-            logger.info_print(f"  {output_line}")
-
-        return returncode
-
-    def _run_with_scrolling_output(self, cmd: list[str], cwd: str) -> int:
-        """运行命令，实时滚动显示最后几行输出
-
-        Args:
-            cmd: 命令列表
-            cwd: 工作目录
-
-        Returns:
-            返回码
+        虚拟环境的 Python 由 install_venv 中的 `pdm use` 写入项目配置，
+        命令本身与是否存在虚拟环境无关，因此这里不再探测解释器路径。
         """
-        process = subprocess.Popen(
-            cmd,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-
-        # 使用 deque 保存最后几行
-        output_buffer = deque(maxlen=MAX_OUTPUT_LINES)
-        line_count = 0
-
-        for line in process.stdout:
-            line = line.strip()
-            if line:
-                output_buffer.append(line)
-                line_count += 1
-
-                # 每次输出时清除并重新打印最后几行
-                sys.stdout.write("\r\033[K")  # 清除当前行
-                # 向上移动到第一个输出的位置
-                if len(output_buffer) > 0:
-                    sys.stdout.write(f"\033[{len(output_buffer)}F")
-                # 重新打印所有缓冲的行
-                for buffered_line in output_buffer:
-                    sys.stdout.write("\r\033[K")  # 清除行
-                    sys.stdout.write(f"  {buffered_line}\n")
-                sys.stdout.flush()
-
-        returncode = process.wait()
-        print()  # 换行
-
-        return returncode
+        return ["pdm"]
 
     def install(self, target_dir: Path, requirements: Path) -> bool:
         """安装依赖"""
@@ -170,18 +85,18 @@ class PDMPackageManager(PackageManager):
 
         logger.step(f"正在安装依赖: {requirements.name}")
 
-        # 设置 PYPIPROXY_REWRITE 环境变量以支持镜像
-        import os
-        env = os.environ.copy()
-        if self.index_url:
-            env["PDM_INDEX_URL"] = self.index_url
-
         if self.verbose:
-            returncode = self._run_with_scrolling_output(cmd, cwd=str(target_dir))
+            returncode = run_with_tail_output(
+                cmd,
+                cwd=str(target_dir),
+                max_lines=MAX_OUTPUT_LINES,
+                scroll=True,
+                env=self._env,
+            )
             if returncode != 0:
                 raise PackageError(f"依赖安装失败，返回码: {returncode}")
         else:
-            result = run_command(cmd, cwd=str(target_dir), check=False, env=env)
+            result = run_command(cmd, cwd=str(target_dir), check=False, env=self._env)
             if result.returncode != 0:
                 raise PackageError(f"依赖安装失败: {result.stderr}")
 
@@ -205,10 +120,7 @@ class PDMPackageManager(PackageManager):
             raise PackageError(f"虚拟环境不存在: {venv_path}")
 
         # 获取虚拟环境的 Python 路径
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
+        python_bin = venv_path / _VENV_PY_REL
 
         if not python_bin.exists():
             raise PackageError(f"虚拟环境 Python 不存在: {python_bin}")
@@ -225,17 +137,18 @@ class PDMPackageManager(PackageManager):
 
         logger.step(f"正在虚拟环境安装依赖: {requirements.name}")
 
-        import os
-        env = os.environ.copy()
-        if self.index_url:
-            env["PDM_INDEX_URL"] = self.index_url
-
         if self.verbose:
-            returncode = self._run_with_scrolling_output(cmd, cwd=str(target_dir))
+            returncode = run_with_tail_output(
+                cmd,
+                cwd=str(target_dir),
+                max_lines=MAX_OUTPUT_LINES,
+                scroll=True,
+                env=self._env,
+            )
             if returncode != 0:
                 raise PackageError(f"依赖安装失败，返回码: {returncode}")
         else:
-            result = run_command(cmd, cwd=str(target_dir), check=False, env=env)
+            result = run_command(cmd, cwd=str(target_dir), check=False, env=self._env)
             if result.returncode != 0:
                 raise PackageError(f"依赖安装失败: {result.stderr}")
 
@@ -244,33 +157,43 @@ class PDMPackageManager(PackageManager):
 
     def add(self, package: str, target_dir: Path) -> bool:
         """添加包"""
+        return self.add_many([package], target_dir)
+
+    def add_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中添加多个包"""
         self.ensure_available()
 
-        cmd = self._get_pdm_command(target_dir) + ["add", package]
+        cmd = self._get_pdm_command(target_dir) + ["add"] + packages
         # PDM index_url 在 config 中设置
 
-        logger.step(f"正在添加包: {package}")
+        names = ", ".join(packages)
+        logger.step(f"正在添加包: {names}")
         result = run_command(cmd, cwd=str(target_dir), check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包添加失败: {result.stderr}")
 
-        logger.success(f"已添加: {package}")
+        logger.success(f"已添加: {names}")
         return True
 
     def remove(self, package: str, target_dir: Path) -> bool:
         """移除包"""
+        return self.remove_many([package], target_dir)
+
+    def remove_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中移除多个包"""
         self.ensure_available()
 
-        cmd = self._get_pdm_command(target_dir) + ["remove", package]
+        cmd = self._get_pdm_command(target_dir) + ["remove"] + packages
 
-        logger.step(f"正在移除包: {package}")
+        names = ", ".join(packages)
+        logger.step(f"正在移除包: {names}")
         result = run_command(cmd, cwd=str(target_dir), check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包移除失败: {result.stderr}")
 
-        logger.success(f"已移除: {package}")
+        logger.success(f"已移除: {names}")
         return True
 
     def update(self, target_dir: Path) -> bool:
@@ -298,10 +221,14 @@ class PDMPackageManager(PackageManager):
         if result.returncode != 0:
             return []
 
+        # 仅在此处需要 JSON 解析，延迟导入以减少启动开销
         try:
-            import json
+            import orjson as _json
+        except ImportError:
+            import json as _json
 
-            packages = json.loads(result.stdout)
-            return [p["name"] for p in packages]
+        try:
+            packages = _json.loads(result.stdout)
+            return list(map(itemgetter("name"), packages))
         except Exception:
             return []
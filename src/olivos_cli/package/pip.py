@@ -3,15 +3,14 @@
 Pip 包管理器实现
 """
 
-import subprocess
 import sys
-from collections import deque
+from operator import itemgetter
 from pathlib import Path
 
 from ..core.exceptions import PackageError
 from ..core.logger import get_logger
-from ..utils import run_command, run_command_stream
-from .base import PackageManager
+from ..utils import run_command, run_with_tail_output
+from .base import _VENV_PY_REL, _venv_python_for
 
 logger = get_logger()
 
@@ -19,7 +18,7 @@ logger = get_logger()
 MAX_OUTPUT_LINES = 4
 
 
-class PipPackageManager(PackageManager):
+class PipPackageManager:
     """Pip 包管理器"""
 
     name = "pip"
@@ -30,114 +29,18 @@ class PipPackageManager(PackageManager):
         self.verbose = verbose
 
     def is_available(self) -> bool:
-        """检查 pip 是否可用"""
-        try:
-            import pip
+        """检查 pip 是否可用
 
-            return True
-        except ImportError:
-            # 确保 pip 可用
-            return True
+        始终通过 `python -m pip` 调用，视为总是可用，不再导入 pip 模块。
+        """
+        return True
 
     def ensure_available(self) -> None:
-        """确保 pip 可用"""
-        if not self.is_available():
-            raise PackageError("pip 不可用")
+        """确保 pip 可用（pip 总是可用，无需检查）"""
 
     def _detect_venv_python(self, target_dir: Path) -> Path:
         """检测目标目录的虚拟环境 Python"""
-        venv_path = target_dir / self.VENV_DIR
-        if not venv_path.exists():
-            return None
-
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
-
-        return python_bin if python_bin.exists() else None
-
-    def _run_with_limited_output(self, cmd: list[str], cwd: str) -> int:
-        """运行命令，只显示最后几行输出
-
-        Args:
-            cmd: 命令列表
-            cwd: 工作目录
-
-        Returns:
-            返回码
-        """
-        process = subprocess.Popen(
-            cmd,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-
-        # 使用 deque 保存最后几行
-        output_buffer = deque(maxlen=MAX_OUTPUT_LINES)
-
-        for line in process.stdout:
-            line = line.strip()
-            if line:
-                output_buffer.append(line)
-
-        returncode = process.wait()
-
-        # 打印最后几行
-        for output_line in output_buffer:
-            logger.info_print(f"  {output_line}")
-
-        return returncode
-
-    def _run_with_scrolling_output(self, cmd: list[str], cwd: str) -> int:
-        """运行命令，实时滚动显示最后几行输出
-
-        Args:
-            cmd: 命令列表
-            cwd: 工作目录
-
-        Returns:
-            返回码
-        """
-        import sys
-
-        process = subprocess.Popen(
-            cmd,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-
-        # 使用 deque 保存最后几行
-        output_buffer = deque(maxlen=MAX_OUTPUT_LINES)
-        line_count = 0
-
-        for line in process.stdout:
-            line = line.strip()
-            if line:
-                output_buffer.append(line)
-                line_count += 1
-
-                # 每次输出时清除并重新打印最后几行
-                sys.stdout.write("\r\033[K")  # 清除当前行
-                # 向上移动到第一个输出的位置
-                if len(output_buffer) > 0:
-                    sys.stdout.write(f"\033[{len(output_buffer)}F")
-                # 重新打印所有缓冲的行
-                for buffered_line in output_buffer:
-                    sys.stdout.write("\r\033[K")  # 清除行
-                    sys.stdout.write(f"  {buffered_line}\n")
-                sys.stdout.flush()
-
-        returncode = process.wait()
-        print()  # 换行
-
-        return returncode
+        return _venv_python_for(str(target_dir), self.VENV_DIR)
 
     def _get_pip_command(self, target_dir: Path = None) -> list[str]:
         """获取 pip 命令，优先使用虚拟环境的 Python"""
@@ -165,7 +68,7 @@ class PipPackageManager(PackageManager):
 
         if self.verbose:
             # 使用限制输出模式（只显示最后几行）
-            returncode = self._run_with_limited_output(cmd, cwd=str(target_dir))
+            returncode = run_with_tail_output(cmd, cwd=str(target_dir), max_lines=MAX_OUTPUT_LINES)
             if returncode != 0:
                 raise PackageError(f"依赖安装失败，返回码: {returncode}")
         else:
@@ -185,6 +88,8 @@ class PipPackageManager(PackageManager):
             requirements: 依赖文件路径
         """
         self.ensure_available()
+        # 虚拟环境可能刚刚创建，丢弃之前的探测结果
+        _venv_python_for.cache_clear()
 
         if not requirements.exists():
             raise PackageError(f"依赖文件不存在: {requirements}")
@@ -193,10 +98,7 @@ class PipPackageManager(PackageManager):
             raise PackageError(f"虚拟环境不存在: {venv_path}")
 
         # 获取虚拟环境的 Python 路径
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
+        python_bin = venv_path / _VENV_PY_REL
 
         if not python_bin.exists():
             raise PackageError(f"虚拟环境 Python 不存在: {python_bin}")
@@ -210,7 +112,7 @@ class PipPackageManager(PackageManager):
 
         if self.verbose:
             # 使用实时滚动输出模式（显示最后 4 行）
-            returncode = self._run_with_scrolling_output(cmd, cwd=str(target_dir))
+            returncode = run_with_tail_output(cmd, cwd=str(target_dir), max_lines=MAX_OUTPUT_LINES, scroll=True)
             if returncode != 0:
                 raise PackageError(f"依赖安装失败，返回码: {returncode}")
         else:
@@ -223,34 +125,44 @@ class PipPackageManager(PackageManager):
 
     def add(self, package: str, target_dir: Path) -> bool:
         """添加包"""
+        return self.add_many([package], target_dir)
+
+    def add_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中添加多个包"""
         self.ensure_available()
 
-        cmd = self._get_pip_command(target_dir) + ["install", package]
+        cmd = self._get_pip_command(target_dir) + ["install"] + packages
         if self.index_url:
             cmd.extend(["--index-url", self.index_url])
 
-        logger.step(f"正在添加包: {package}")
+        names = ", ".join(packages)
+        logger.step(f"正在添加包: {names}")
         result = run_command(cmd, cwd=str(target_dir), check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包添加失败: {result.stderr}")
 
-        logger.success(f"已添加: {package}")
+        logger.success(f"已添加: {names}")
         return True
 
     def remove(self, package: str, target_dir: Path) -> bool:
         """移除包"""
+        return self.remove_many([package], target_dir)
+
+    def remove_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中移除多个包"""
         self.ensure_available()
 
-        cmd = self._get_pip_command(target_dir) + ["uninstall", "-y", package]
+        cmd = self._get_pip_command(target_dir) + ["uninstall", "-y"] + packages
 
-        logger.step(f"正在移除包: {package}")
+        names = ", ".join(packages)
+        logger.step(f"正在移除包: {names}")
         result = run_command(cmd, cwd=str(target_dir), check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包移除失败: {result.stderr}")
 
-        logger.success(f"已移除: {package}")
+        logger.success(f"已移除: {names}")
         return True
 
     def update(self, target_dir: Path) -> bool:
@@ -280,10 +192,14 @@ class PipPackageManager(PackageManager):
         if result.returncode != 0:
             return []
 
+        # 仅在此处需要 JSON 解析，延迟导入以减少启动开销
         try:
-            import json
+            import orjson as _json
+        except ImportError:
+            import json as _json
 
-            packages = json.loads(result.stdout)
-            return [p["name"] for p in packages]
+        try:
+            packages = _json.loads(result.stdout)
+            return list(map(itemgetter("name"), packages))
         except Exception:
             return []
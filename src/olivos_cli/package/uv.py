@@ -3,22 +3,117 @@
 UV 包管理器实现
 """
 
+import os
+import platform
 import shutil
 import subprocess
+import sys
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
 
 from ..core.exceptions import PackageError
 from ..core.logger import get_logger
-from ..utils import check_command, run_command, run_command_stream
-from .base import PackageManager
+from ..utils import check_command, find_command, resolve_cache, run_command, run_command_stream
+from .base import _VENV_PY_REL
 
 logger = get_logger()
 
-
-class UVPackageManager(PackageManager):
+# uv 独立二进制的下载地址与安装目录
+_UV_DOWNLOAD_URL = "https://github.com/astral-sh/uv/releases/latest/download/uv-{triple}.tar.gz"
+_UV_INSTALL_DIR = Path.home() / ".local" / "bin"
+# 下载的压缩包超过该大小时才落盘
+_UV_SPOOL_SIZE = 64 * 1024 * 1024
+
+# (sys.platform, platform.machine()) -> 发布包的目标三元组
+_UV_TRIPLES = {
+    ("linux", "x86_64"): "x86_64-unknown-linux-gnu",
+    ("linux", "amd64"): "x86_64-unknown-linux-gnu",
+    ("linux", "aarch64"): "aarch64-unknown-linux-gnu",
+    ("linux", "arm64"): "aarch64-unknown-linux-gnu",
+    ("darwin", "x86_64"): "x86_64-apple-darwin",
+    ("darwin", "arm64"): "aarch64-apple-darwin",
+}
+
+
+def _pyvenv_tag(cfg: Path) -> Optional[str]:
+    """从虚拟环境的 pyvenv.cfg 读取解释器实现与版本，如 cpython-3.12.1"""
+    try:
+        text = cfg.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    values = {}
+    for line in text.splitlines():
+        name, sep, value = line.partition("=")
+        if sep:
+            values[name.strip().lower()] = value.strip()
+    version = values.get("version_info") or values.get("version")
+    if not version:
+        return None
+    return f"{values.get('implementation', 'cpython').lower()}-{version}"
+
+
+def _download_uv() -> bool:
+    """下载 uv 独立二进制到 ~/.local/bin
+
+    Returns:
+        是否成功；当前平台没有对应的预编译包时返回 False
+    """
+    triple = _UV_TRIPLES.get((sys.platform, platform.machine().lower()))
+    if triple is None:
+        return False
+
+    import hashlib
+    import tarfile
+    import tempfile
+    import urllib.request
+
+    url = _UV_DOWNLOAD_URL.format(triple=triple)
+    target = _UV_INSTALL_DIR / "uv"
+
+    # 发布页在每个文件旁提供 <文件名>.sha256，内容为 "<摘要>  <文件名>"
+    with urllib.request.urlopen(url + ".sha256", timeout=30) as resp:
+        expected = resp.read().decode("ascii", "replace").split()[0].lower()
+
+    # 先下载并校验摘要，校验通过后再解压，只取出 uv 可执行文件
+    with tempfile.SpooledTemporaryFile(max_size=_UV_SPOOL_SIZE) as archive:
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            for chunk in iter(lambda: resp.read(1 << 16), b""):
+                digest.update(chunk)
+                archive.write(chunk)
+        if digest.hexdigest() != expected:
+            logger.warning(f"uv 下载文件校验失败: {url}")
+            return False
+
+        archive.seek(0)
+        _UV_INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+            for member in tar:
+                if member.isfile() and Path(member.name).name == "uv":
+                    src = tar.extractfile(member)
+                    tmp = target.with_name("uv.tmp")
+                    with open(tmp, "wb") as f:
+                        shutil.copyfileobj(src, f)
+                    tmp.chmod(0o755)
+                    os.replace(tmp, target)
+                    break
+            else:
+                return False
+
+    # 确保当前进程及子进程能找到刚安装的 uv
+    install_dir = str(_UV_INSTALL_DIR)
+    if install_dir not in os.environ.get("PATH", "").split(os.pathsep):
+        os.environ["PATH"] = install_dir + os.pathsep + os.environ.get("PATH", "")
+    return True
+
+
+class UVPackageManager:
     """UV 包��理器"""
 
     name = "uv"
+    # 进程内缓存的 uv 可用性检测结果
+    _uv_available: Optional[bool] = None
 
     def __init__(self, auto_install: bool = True, index_url: str = None, verbose: bool = False):
         self.auto_install = auto_install
@@ -26,8 +121,11 @@ class UVPackageManager(PackageManager):
         self.verbose = verbose
 
     def is_available(self) -> bool:
-        """检查 uv 是否可用"""
-        return check_command("uv")
+        """检查 uv 是否可用（结果在进程内缓存）"""
+        cls = type(self)
+        if cls._uv_available is None:
+            cls._uv_available = check_command("uv")
+        return cls._uv_available
 
     def ensure_available(self) -> None:
         """确保 uv 可用"""
@@ -40,55 +138,157 @@ class UVPackageManager(PackageManager):
         """安装 uv"""
         logger.step("正在安装 uv...")
         try:
-            # 尝试使用 pip 安装
-            result = subprocess.run(
-                ["pip", "install", "uv"],
-                capture=True,
-                text=True,
-            )
-            if result.returncode != 0:
+            # 优先直接下载预编译的独立二进制
+            try:
+                installed = _download_uv()
+            except Exception as e:
+                logger.debug(f"下载 uv 独立二进制失败: {e}")
+                installed = False
+
+            if not installed:
                 # 尝试使用官方安装脚本
                 result = subprocess.run(
-                    ["curl", "-LsSf", "https://astral.sh/uv/install.sh", "|", "sh"],
+                    "curl -LsSf https://astral.sh/uv/install.sh | sh",
                     shell=True,
                 )
                 if result.returncode != 0:
-                    raise PackageError("uv 安装失败")
+                    # 最后尝试使用 pip 安装
+                    result = run_command([sys.executable, "-m", "pip", "install", "uv"], check=False)
+                    if result.returncode != 0:
+                        raise PackageError("uv 安装失败")
+            # 安装后重新查找 uv
+            find_command.cache_clear()
+            type(self)._uv_available = None
             logger.success("uv 安装成功")
         except Exception as e:
             raise PackageError(f"uv 安装失败: {e}") from e
 
-    def install(self, target_dir: Path, requirements: Path) -> bool:
-        """安装依赖"""
+    def install(self, target_dir: Path, requirements: Path, force_resolve: bool = False) -> bool:
+        """安装依赖
+
+        force_resolve 为 True 时不使用缓存的解析结果，始终按依赖文件重新解析安装。
+        """
         self.ensure_available()
 
         if not requirements.exists():
             raise PackageError(f"依赖文件不存在: {requirements}")
 
-        cmd = ["uv", "pip", "install", "-r", str(requirements)]
+        pinned = None
+        key = None
+        # 解析结果与安装目标的解释器相关，无法确定目标解释器时不使用缓存
+        python = self._target_python(target_dir)
+        if python is not None:
+            key = resolve_cache.cache_key(requirements, python[1], self.index_url)
+        if key is not None:
+            if not force_resolve:
+                pinned = resolve_cache.lookup(key)
+            if pinned is None:
+                # 只解析一次：先编译出锁定版本写入缓存，再按锁定版本安装
+                pinned = self._compile(target_dir, requirements, python[0], key)
+        if pinned is not None:
+            cmd = ["uv", "pip", "install", "--no-deps", "-r", str(pinned)]
+            logger.step(f"正在按解析结果安装依赖: {requirements.name}")
+        else:
+            cmd = ["uv", "pip", "install", "-r", str(requirements)]
+            logger.step(f"正在安装依赖: {requirements.name}")
         if self.index_url:
             cmd.extend(["--index-url", self.index_url])
 
-        logger.step(f"正在安装依赖: {requirements.name}")
+        if self.verbose:
+            # 使用流式输出
+            returncode = run_command_stream(
+                cmd,
+                cwd=target_dir,
+                line_callback=lambda line: logger.verbose(line),
+                error_callback=lambda line: logger.verbose(line),
+            )
+            error = f"依赖安装失败，返回码: {returncode}"
+        else:
+            result = run_command(cmd, cwd=target_dir, check=False)
+            returncode = result.returncode
+            error = f"依赖安装失败: {result.stderr}"
+
+        if returncode != 0:
+            if pinned is not None:
+                # 解析结果可能已过期，下次重新解析
+                resolve_cache.invalidate(key)
+            raise PackageError(error)
+
+        logger.success("依赖安装成功")
+        return True
+
+    def sync(self, target_dir: Path) -> bool:
+        """按目标目录的 uv.lock 同步项目虚拟环境（uv sync --frozen）
+
+        跳过依赖解析，但会移除锁文件之外的包，因此不会由 install 自动调用。
+        """
+        self.ensure_available()
+
+        if not (target_dir / "uv.lock").is_file():
+            raise PackageError(f"锁文件不存在: {target_dir / 'uv.lock'}")
+
+        cmd = ["uv", "sync", "--frozen"]
+        logger.step("正在按 uv.lock 同步依赖")
 
         if self.verbose:
             # 使用流式输出
             returncode = run_command_stream(
                 cmd,
-                cwd=str(target_dir),
+                cwd=target_dir,
                 line_callback=lambda line: logger.verbose(line),
                 error_callback=lambda line: logger.verbose(line),
             )
             if returncode != 0:
-                raise PackageError(f"依赖安装失败，返回码: {returncode}")
+                raise PackageError(f"依赖同步失败，返回码: {returncode}")
         else:
-            result = run_command(cmd, cwd=str(target_dir), check=False)
+            result = run_command(cmd, cwd=target_dir, check=False)
             if result.returncode != 0:
-                raise PackageError(f"依赖安装失败: {result.stderr}")
+                raise PackageError(f"依赖同步失败: {result.stderr}")
 
-        logger.success("依赖安装成功")
+        logger.success("依赖同步成功")
         return True
 
+    def _target_python(self, target_dir: Path) -> Optional[tuple[str, str]]:
+        """获取 uv 在目标目录下使用的解释器
+
+        Returns:
+            (解释器路径, 实现与版本标识，如 cpython-3.12.1)，无法确定时返回 None
+        """
+        result = run_command(["uv", "python", "find"], cwd=target_dir, check=False)
+        python = result.stdout.strip() if result.returncode == 0 else ""
+        if not python:
+            return None
+
+        # 虚拟环境的解释器直接读取 pyvenv.cfg，避免再启动一次解释器
+        tag = _pyvenv_tag(Path(python).parent.parent / "pyvenv.cfg")
+        if tag is None:
+            result = run_command(
+                [python, "-c", "import platform; print(platform.python_implementation().lower() "
+                 "+ '-' + platform.python_version())"],
+                check=False,
+            )
+            tag = result.stdout.strip() if result.returncode == 0 else None
+        return (python, tag) if tag else None
+
+    def _compile(self, target_dir: Path, requirements: Path, python: str, key: str) -> Optional[Path]:
+        """解析依赖文件（uv pip compile），把锁定版本列表写入缓存
+
+        Returns:
+            缓存的锁定版本文件，解析失败时返回 None
+        """
+        cmd = [
+            "uv", "pip", "compile", str(requirements),
+            "--python", python, "--no-header", "--no-annotate",
+        ]
+        if self.index_url:
+            cmd.extend(["--index-url", self.index_url])
+        logger.step(f"正在解析依赖: {requirements.name}")
+        result = run_command(cmd, cwd=target_dir, check=False)
+        if result.returncode != 0 or not result.stdout.strip():
+            # 解析失败时退回直接安装，由安装步骤报告具体错误
+            return None
+        return resolve_cache.store(key, result.stdout)
+
     def install_venv(self, target_dir: Path, venv_path: Path, requirements: Path) -> bool:
         """在虚拟环境中安装依赖
 
@@ -106,12 +306,7 @@ class UVPackageManager(PackageManager):
             raise PackageError(f"虚拟环境不存在: {venv_path}")
 
         # 使用 --python 参数指定虚拟环境的 Python
-        import sys
-
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
+        python_bin = venv_path / _VENV_PY_REL
 
         if not python_bin.exists():
             raise PackageError(f"虚拟环境 Python 不存在: {python_bin}")
@@ -126,14 +321,14 @@ class UVPackageManager(PackageManager):
             # 使用流式输出
             returncode = run_command_stream(
                 cmd,
-                cwd=str(target_dir),
+                cwd=target_dir,
                 line_callback=lambda line: logger.verbose(line),
                 error_callback=lambda line: logger.verbose(line),
             )
             if returncode != 0:
                 raise PackageError(f"依赖安装失败，返回码: {returncode}")
         else:
-            result = run_command(cmd, cwd=str(target_dir), check=False)
+            result = run_command(cmd, cwd=target_dir, check=False)
             if result.returncode != 0:
                 raise PackageError(f"依赖安装失败: {result.stderr}")
 
@@ -142,34 +337,44 @@ class UVPackageManager(PackageManager):
 
     def add(self, package: str, target_dir: Path) -> bool:
         """添加包"""
+        return self.add_many([package], target_dir)
+
+    def add_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中添加多个包"""
         self.ensure_available()
 
-        cmd = ["uv", "pip", "install", package]
+        cmd = ["uv", "pip", "install"] + packages
         if self.index_url:
             cmd.extend(["--index-url", self.index_url])
 
-        logger.step(f"正在添加包: {package}")
-        result = run_command(cmd, cwd=str(target_dir), check=False)
+        names = ", ".join(packages)
+        logger.step(f"正在添加包: {names}")
+        result = run_command(cmd, cwd=target_dir, check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包添加失败: {result.stderr}")
 
-        logger.success(f"已添加: {package}")
+        logger.success(f"已添加: {names}")
         return True
 
     def remove(self, package: str, target_dir: Path) -> bool:
         """移除包"""
+        return self.remove_many([package], target_dir)
+
+    def remove_many(self, packages: list[str], target_dir: Path) -> bool:
+        """在一次调用中移除多个包"""
         self.ensure_available()
 
-        cmd = ["uv", "pip", "uninstall", "-y", package]
+        cmd = ["uv", "pip", "uninstall", "-y"] + packages
 
-        logger.step(f"正在移除包: {package}")
-        result = run_command(cmd, cwd=str(target_dir), check=False)
+        names = ", ".join(packages)
+        logger.step(f"正在移除包: {names}")
+        result = run_command(cmd, cwd=target_dir, check=False)
 
         if result.returncode != 0:
             raise PackageError(f"包移除失败: {result.stderr}")
 
-        logger.success(f"已移除: {package}")
+        logger.success(f"已移除: {names}")
         return True
 
     def update(self, target_dir: Path) -> bool:
@@ -181,14 +386,14 @@ class UVPackageManager(PackageManager):
             cmd.extend(["--index-url", self.index_url])
 
         logger.step("正在更新依赖...")
-        result = run_command(cmd, cwd=str(target_dir), check=False)
+        result = run_command(cmd, cwd=target_dir, check=False)
 
         if result.returncode != 0:
             # uv sync 可能会失败，尝试逐个更新
             cmd = ["uv", "pip", "install", "--upgrade"]
             if self.index_url:
                 cmd.extend(["--index-url", self.index_url])
-            result = run_command(cmd, cwd=str(target_dir), check=False)
+            result = run_command(cmd, cwd=target_dir, check=False)
 
         logger.success("依赖更新成功")
         return True
@@ -198,15 +403,19 @@ class UVPackageManager(PackageManager):
         self.ensure_available()
 
         cmd = ["uv", "pip", "list", "--format=json"]
-        result = run_command(cmd, cwd=str(target_dir), capture=True)
+        result = run_command(cmd, cwd=target_dir, capture=True)
 
         if result.returncode != 0:
             return []
 
+        # 仅在此处需要 JSON 解析，延迟导入以减少启动开销
         try:
-            import json
+            import orjson as _json
+        except ImportError:
+            import json as _json
 
-            packages = json.loads(result.stdout)
-            return [p["name"] for p in packages]
+        try:
+            packages = _json.loads(result.stdout)
+            return list(map(itemgetter("name"), packages))
         except Exception:
             return []
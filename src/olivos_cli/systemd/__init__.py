@@ -3,8 +3,8 @@
 systemd 集成模块
 """
 
-from .service import SystemdManager, generate_service_file
-from .template import ServiceTemplateData, render_service_template
+from .service import SystemdManager
+from .template import ServiceTemplateData, generate_service_file, render_service_template
 
 __all__ = [
     "SystemdManager",
@@ -11,14 +11,20 @@ from typing import Optional
 from ..core.config import ConfigManager, expand_path
 from ..core.exceptions import SystemdError
 from ..core.logger import get_logger
-from ..utils import run_command
-from .template import ServiceTemplateData, generate_service_file
+from ..package.base import _venv_python_for
+from ..utils import ensure_file, run_command
+from .template import ServiceTemplateData, render_service_template
 
 logger = get_logger()
 
 # 虚拟环境目录名
 VENV_DIR = ".venv"
 
+# `systemctl is-enabled` 返回 0 的 UnitFileState 取值
+_ENABLED_STATES = frozenset(
+    {"enabled", "enabled-runtime", "alias", "static", "indirect", "generated", "transient"}
+)
+
 
 class SystemdManager:
     """systemd 服务管理器"""
@@ -37,7 +43,7 @@ class SystemdManager:
     def _run_systemctl(self, args: list[str], check: bool = False) -> bool:
         """运行 systemctl 命令"""
         cmd = self._get_systemctl_cmd() + args
-        result = run_command(cmd, check=check)
+        result = run_command(cmd, check=check, discard=True)
         return result.returncode == 0
 
     def _detect_venv_python(self, working_directory: Path) -> Optional[str]:
@@ -49,24 +55,15 @@ class SystemdManager:
         Returns:
             虚拟环境 Python 路径，如果不存在则返回 None
         """
-        venv_path = working_directory / VENV_DIR
-        if not venv_path.exists():
-            return None
-
-        if sys.platform == "win32":
-            python_bin = venv_path / "Scripts" / "python.exe"
-        else:
-            python_bin = venv_path / "bin" / "python"
-
-        if python_bin.exists():
-            return str(python_bin)
-        return None
+        python_bin = _venv_python_for(str(working_directory), VENV_DIR)
+        return str(python_bin) if python_bin else None
 
     def install_service(
         self,
         name: str,
         working_directory: Path,
         config: Optional[ConfigManager] = None,
+        force: bool = False,
     ) -> Path:
         """安装服务
 
@@ -74,11 +71,14 @@ class SystemdManager:
             name: 服务名称
             working_directory: 工作目录
             config: 配置管理器
+            force: 是否忽略缓存，重新检测虚拟环境
 
         Returns:
             service 文件路径
         """
         # 检测虚拟环境
+        if force:
+            _venv_python_for.cache_clear()
         venv_python = self._detect_venv_python(working_directory)
         if venv_python:
             logger.info_print(f"使用虚拟环境 Python: {venv_python}")
@@ -115,10 +115,9 @@ class SystemdManager:
         service_path.write_text(content, encoding="utf-8")
 
         # 创建日志目录
-        log_dir = Path(template_data.log_file).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
-        Path(template_data.log_file).touch(exist_ok=True)
-        Path(template_data.error_log_file).touch(exist_ok=True)
+        os.makedirs(os.path.dirname(template_data.log_file), exist_ok=True)
+        ensure_file(template_data.log_file)
+        ensure_file(template_data.error_log_file)
 
         # 重载 systemd
         self._run_systemctl(["daemon-reload"])
@@ -144,45 +143,54 @@ class SystemdManager:
 
         return False
 
-    def enable(self, name: str) -> bool:
-        """启用开机自启"""
-        service_filename = f"{name}.service"
-        result = self._run_systemctl(["enable", service_filename])
+    def _unit_action(self, action: str, names: tuple[str, ...], done: str) -> bool:
+        """对多个服务执行同一 systemctl 动作（单次调用）"""
+        if not names:
+            return True
+        result = self._run_systemctl([action, *(f"{name}.service" for name in names)])
         if result:
-            logger.success(f"服务已启用: {name}")
+            logger.success(f"{done}: {', '.join(names)}")
         return result
 
+    def enable(self, name: str) -> bool:
+        """启用开机自启"""
+        return self.enable_many(name)
+
+    def enable_many(self, *names: str) -> bool:
+        """批量启用开机自启"""
+        return self._unit_action("enable", names, "服务已启用")
+
     def disable(self, name: str) -> bool:
         """禁用开机自启"""
-        service_filename = f"{name}.service"
-        result = self._run_systemctl(["disable", service_filename])
-        if result:
-            logger.success(f"服务已禁用: {name}")
-        return result
+        return self.disable_many(name)
+
+    def disable_many(self, *names: str) -> bool:
+        """批量禁用开机自启"""
+        return self._unit_action("disable", names, "服务已禁用")
 
     def start(self, name: str) -> bool:
         """启动服务"""
-        service_filename = f"{name}.service"
-        result = self._run_systemctl(["start", service_filename])
-        if result:
-            logger.success(f"服务已启动: {name}")
-        return result
+        return self.start_many(name)
+
+    def start_many(self, *names: str) -> bool:
+        """批量启动服务"""
+        return self._unit_action("start", names, "服务已启动")
 
     def stop(self, name: str) -> bool:
         """停止服务"""
-        service_filename = f"{name}.service"
-        result = self._run_systemctl(["stop", service_filename])
-        if result:
-            logger.success(f"服务已停止: {name}")
-        return result
+        return self.stop_many(name)
+
+    def stop_many(self, *names: str) -> bool:
+        """批量停止服务"""
+        return self._unit_action("stop", names, "服务已停止")
 
     def restart(self, name: str) -> bool:
         """重启服务"""
-        service_filename = f"{name}.service"
-        result = self._run_systemctl(["restart", service_filename])
-        if result:
-            logger.success(f"服务已重启: {name}")
-        return result
+        return self.restart_many(name)
+
+    def restart_many(self, *names: str) -> bool:
+        """批量重启服务"""
+        return self._unit_action("restart", names, "服务已重启")
 
     def status(self, name: str) -> dict:
         """获取服务状态"""
@@ -190,41 +198,33 @@ class SystemdManager:
         cmd = self._get_systemctl_cmd() + [
             "show",
             service_filename,
-            "--property=LoadState,ActiveState,SubState,MainPID",
+            "--property=LoadState,ActiveState,SubState,MainPID,UnitFileState",
         ]
         result = run_command(cmd, capture=True)
 
         if result.returncode != 0:
             return {"loaded": False, "active": False, "running": False}
 
-        status = {}
-        for line in result.stdout.strip().split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                status[key] = value
+        # 单次遍历解析 KEY=VALUE 输出
+        status = dict(line.split("=", 1) for line in result.stdout.splitlines() if "=" in line)
 
         loaded = status.get("LoadState", "not-found") == "loaded"
         active = status.get("ActiveState", "inactive") == "active"
         running = status.get("SubState", "dead") == "running"
-        pid = int(status.get("MainPID", 0)) if status.get("MainPID", "0") != "0" else None
+        main_pid = status.get("MainPID", "0")
+        pid = int(main_pid) if main_pid != "0" else None
 
         return {
             "loaded": loaded,
             "active": active,
             "running": running,
-            "enabled": self._is_enabled(name),
+            "enabled": status.get("UnitFileState") in _ENABLED_STATES,
             "pid": pid,
         }
 
     def _is_enabled(self, name: str) -> bool:
         """检查服务是否已启用"""
-        service_filename = f"{name}.service"
-        cmd = self._get_systemctl_cmd() + [
-            "is-enabled",
-            service_filename,
-        ]
-        result = run_command(cmd, capture=True)
-        return result.returncode == 0
+        return self.status(name).get("enabled", False)
 
     def logs(
         self,
@@ -247,14 +247,3 @@ class SystemdManager:
     def get_service_path(self, name: str) -> Path:
         """获取 service 文件路径"""
         return self.service_dir / f"{name}.service"
-
-
-# 导入 render_service_template 函数
-from .template import render_service_template
-
-__all__ = [
-    "SystemdManager",
-    "generate_service_file",
-    "ServiceTemplateData",
-    "render_service_template",
-]
@@ -6,6 +6,7 @@ systemd service 模板生成
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -71,6 +72,7 @@ class ServiceTemplateData:
 
 
 # 获取模板目录
+@lru_cache(maxsize=1)
 def get_template_dir() -> Path:
     """获取模板目录路径"""
     # 尝试从包内获取
@@ -87,6 +89,18 @@ def get_template_dir() -> Path:
     return Path(__file__).parent.parent.parent.parent / "templates"
 
 
+@lru_cache(maxsize=1)
+def _get_service_template():
+    """获取编译后的 service 模板（进程内只编译一次）"""
+    env = Environment(
+        loader=FileSystemLoader(get_template_dir()),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    return env.get_template("systemd.service.jinja2")
+
+
 def render_service_template(data: ServiceTemplateData) -> str:
     """渲染 service 模板
 
@@ -98,17 +112,8 @@ def render_service_template(data: ServiceTemplateData) -> str:
     """
     if Environment is not None:
         # 使用 Jinja2
-        template_dir = get_template_dir()
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
         try:
-            template = env.get_template("systemd.service.jinja2")
-            return template.render(**data.__dict__)
+            return _get_service_template().render(data.__dict__)
         except Exception as e:
             logger.warning_print(f"Jinja2 渲染失败: {e}，使用回退方案")
 
@@ -118,69 +123,64 @@ def render_service_template(data: ServiceTemplateData) -> str:
 
 def _render_fallback(data: ServiceTemplateData) -> str:
     """回退渲染方案"""
+    parts = [
+        "[Unit]",
+        f"Description={data.description}",
+        "Documentation=https://github.com/OlivOS-Team/OlivOS",
+        "After=network.target",
+    ]
     # 处理依赖（用户模式下不使用 network-online.target）
     if data.depends_on_services:
-        depends_on = f"Requires={' '.join(data.depends_on_services)}\n"
-    else:
-        depends_on = ""
-
-    # 处理环境变量
-    environment_vars = "\n".join(
-        [f'Environment="{k}={v}"' for k, v in data.environment.items()]
-    )
-
-    # 处理地址族
-    restrict_families = " ".join(data.restrict_address_families)
-
-    # 布尔值转换
-    private_tmp = "true" if data.private_tmp else "false"
-    no_new_privileges = "true" if data.no_new_privileges else "false"
-
+        parts.append(f"Requires={' '.join(data.depends_on_services)}")
+
+    parts += [
+        "",
+        "[Service]",
+        "Type=simple",
+        f"User={data.user}",
+        f"Group={data.group}",
+        f"WorkingDirectory={data.working_directory}",
+        "",
+        "# 环境变量",
+        'Environment="PATH=/usr/local/bin:/usr/bin:/bin"',
+    ]
+    parts.extend(f'Environment="{k}={v}"' for k, v in data.environment.items())
+
+    parts += [
+        "",
+        "# 启动命令",
+        f"ExecStart={data.python_executable} {data.main_script}",
+        "",
+        "# 重启策略",
+        f"Restart={data.restart_policy}",
+        f"RestartSec={data.restart_sec}",
+        "",
+        "# 安全限制",
+        f"RestrictAddressFamilies={' '.join(data.restrict_address_families)}",
+        f"PrivateTmp={'true' if data.private_tmp else 'false'}",
+        f"NoNewPrivileges={'true' if data.no_new_privileges else 'false'}",
+    ]
     # 处理资源限制
-    memory_limit = f"MemoryLimit={data.memory_limit}" if data.memory_limit else ""
-    cpu_quota = f"CPUQuota={data.cpu_quota}" if data.cpu_quota else ""
-
-    return f"""[Unit]
-Description={data.description}
-Documentation=https://github.com/OlivOS-Team/OlivOS
-After=network.target
-{depends_on}
-
-[Service]
-Type=simple
-User={data.user}
-Group={data.group}
-WorkingDirectory={data.working_directory}
-
-# 环境变量
-Environment="PATH=/usr/local/bin:/usr/bin:/bin"
-{environment_vars}
-
-# 启动命令
-ExecStart={data.python_executable} {data.main_script}
-
-# 重启策略
-Restart={data.restart_policy}
-RestartSec={data.restart_sec}
-
-# 安全限制
-RestrictAddressFamilies={restrict_families}
-PrivateTmp={private_tmp}
-NoNewPrivileges={no_new_privileges}
-{memory_limit}
-{cpu_quota}
-
-# 日志
-StandardOutput=append:{data.log_file}
-StandardError=append:{data.error_log_file}
-
-# 超时
-TimeoutStartSec={data.timeout_start_sec}
-TimeoutStopSec={data.timeout_stop_sec}
-
-[Install]
-WantedBy={data.wanted_by}
-"""
+    if data.memory_limit:
+        parts.append(f"MemoryLimit={data.memory_limit}")
+    if data.cpu_quota:
+        parts.append(f"CPUQuota={data.cpu_quota}")
+
+    parts += [
+        "",
+        "# 日志",
+        f"StandardOutput=append:{data.log_file}",
+        f"StandardError=append:{data.error_log_file}",
+        "",
+        "# 超时",
+        f"TimeoutStartSec={data.timeout_start_sec}",
+        f"TimeoutStopSec={data.timeout_stop_sec}",
+        "",
+        "[Install]",
+        f"WantedBy={data.wanted_by}",
+        "",
+    ]
+    return "\n".join(parts)
 
 
 def generate_service_file(
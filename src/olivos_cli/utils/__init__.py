@@ -6,15 +6,21 @@
 import shutil
 import subprocess
 import sys
-from typing import Optional, Callable
+from functools import lru_cache
+from os import PathLike
+from typing import Optional, Callable, Union
+
+# 读取子进程输出的块大小
+_READ_CHUNK_SIZE = 64 * 1024
 
 
 def run_command(
     cmd: list[str],
-    cwd: Optional[str] = None,
+    cwd: Optional[Union[str, PathLike]] = None,
     capture: bool = True,
     check: bool = False,
     env: Optional[dict[str, str]] = None,
+    discard: bool = False,
 ) -> subprocess.CompletedProcess:
     """运行 shell 命令
 
@@ -24,10 +30,21 @@ def run_command(
         capture: 是否捕获输出
         check: 是否检查返回码
         env: 环境变量
+        discard: 是否丢弃输出（只关心返回码时使用，忽略 capture）
 
     Returns:
         subprocess.CompletedProcess
     """
+    if discard:
+        # 输出直接交给 /dev/null，无需读取和解码
+        return subprocess.run(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=check,
+            env=env,
+        )
     return subprocess.run(
         cmd,
         cwd=cwd,
@@ -40,7 +57,7 @@ def run_command(
 
 def run_command_stream(
     cmd: list[str],
-    cwd: Optional[str] = None,
+    cwd: Optional[Union[str, PathLike]] = None,
     env: Optional[dict[str, str]] = None,
     line_callback: Optional[Callable[[str], None]] = None,
     error_callback: Optional[Callable[[str], None]] = None,
@@ -63,50 +80,201 @@ def run_command_stream(
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
-        bufsize=1,  # 行缓冲
+        bufsize=-1,  # 默认块缓冲；POSIX 下直接按块读取原始字节
         env=env,
     )
 
+    def on_stdout(line: str) -> None:
+        if line_callback:
+            line_callback(line)
+        elif line.strip():
+            print(f"  {line}")
+
+    def on_stderr(line: str) -> None:
+        if error_callback:
+            error_callback(line)
+        elif line.strip():
+            print(f"  {line}", file=sys.stderr)
+
+    if sys.platform == "win32":
+        # Windows 的 selectors 不支持管道，使用读取线程
+        return _stream_with_threads(process, on_stdout, on_stderr)
+    return _stream_with_selector(process, on_stdout, on_stderr)
+
+
+def _stream_with_selector(
+    process: subprocess.Popen,
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+) -> int:
+    """在当前线程中用 selectors 同时读取 stdout 与 stderr"""
+    import os
+    import selectors
+
+    handlers = {
+        process.stdout.fileno(): on_stdout,
+        process.stderr.fileno(): on_stderr,
+    }
+    pending = dict.fromkeys(handlers, b"")
+
+    with selectors.DefaultSelector() as selector:
+        for fd in handlers:
+            selector.register(fd, selectors.EVENT_READ)
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                fd = key.fd
+                chunk = os.read(fd, _READ_CHUNK_SIZE)
+                if chunk:
+                    data = pending[fd] + chunk
+                    lines = data.splitlines()
+                    if data.endswith(b"\n"):
+                        pending[fd] = b""
+                    else:
+                        # 最后一段可能不完整；以 \r 结尾时保留它，以便与下一块的 \n 组成 \r\n
+                        pending[fd] = lines.pop() + (b"\r" if data.endswith(b"\r") else b"")
+                else:
+                    # EOF
+                    selector.unregister(fd)
+                    lines = pending[fd].splitlines()
+                    pending[fd] = b""
+                # 按完整的行解码，多字节字符不会被块边界截断
+                for line in lines:
+                    handlers[fd](line.decode("utf-8", errors="replace"))
+
+    process.stdout.close()
+    process.stderr.close()
+    return process.wait()
+
+
+def _stream_with_threads(
+    process: subprocess.Popen,
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+) -> int:
+    """为 stdout 与 stderr 各启动一个读取线程"""
     import threading
 
-    returncode = [0]  # 使用列表以便在闭包中修改
-
-    def read_stdout():
-        for line in process.stdout:
-            line = line.rstrip('\n\r')
-            if line_callback:
-                line_callback(line)
-            elif line.strip():
-                print(f"  {line}")
-
-    def read_stderr():
-        nonlocal returncode
-        for line in process.stderr:
-            line = line.rstrip('\n\r')
-            if error_callback:
-                error_callback(line)
-            elif line.strip():
-                print(f"  {line}", file=sys.stderr)
+    def read(stream, handler) -> None:
+        for line in stream:
+            handler(line.rstrip('\n\r'))
 
     # 启动线程读取输出
-    stdout_thread = threading.Thread(target=read_stdout, daemon=True)
-    stderr_thread = threading.Thread(target=read_stderr, daemon=True)
+    stdout_thread = threading.Thread(target=read, args=(process.stdout, on_stdout), daemon=True)
+    stderr_thread = threading.Thread(target=read, args=(process.stderr, on_stderr), daemon=True)
 
     stdout_thread.start()
     stderr_thread.start()
 
     # 等待进程结束
-    returncode[0] = process.wait()
+    returncode = process.wait()
 
     # 等待输出线程结束
     stdout_thread.join(timeout=1)
     stderr_thread.join(timeout=1)
 
-    return returncode[0]
+    return returncode
+
+
+# 滚动显示时两次重绘的最小间隔（秒）
+_REPAINT_INTERVAL = 0.05
+
+
+def run_with_tail_output(
+    cmd: list[str],
+    cwd: Optional[Union[str, PathLike]] = None,
+    max_lines: int = 4,
+    scroll: bool = False,
+    env: Optional[dict[str, str]] = None,
+) -> int:
+    """运行命令，只显示最后几行输出
+
+    Args:
+        cmd: 命令列表
+        cwd: 工作目录
+        max_lines: 显示的最大行数
+        scroll: 是否实时滚动显示；否则在命令结束后打印最后几行
+        env: 环境变量
+
+    Returns:
+        返回码
+    """
+    import os
+    import time
+    from collections import deque
 
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=_READ_CHUNK_SIZE,
+        env=env,
+    )
 
+    # 使用 deque 保存最后几行；按块读取原始字节，只解码需要显示的行
+    output_buffer = deque(maxlen=max_lines)
+    fd = process.stdout.fileno()
+    pending = b""
+    painted = 0
+    last_paint = 0.0
+    dirty = False
+
+    def repaint() -> None:
+        nonlocal painted
+        parts = []
+        if painted:
+            # 回到上次输出的第一行
+            parts.append(f"\033[{painted}F")
+        for line in output_buffer:
+            parts.append(f"\r\033[K  {line.decode('utf-8', errors='replace')}\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+        painted = len(output_buffer)
+
+    while chunk := os.read(fd, _READ_CHUNK_SIZE):
+        data = pending + chunk
+        lines = data.splitlines()
+        # 最后一段没有换行符时可能不完整，留到下一块
+        pending = b"" if data.endswith((b"\n", b"\r")) else lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                output_buffer.append(line)
+                dirty = True
+
+        if scroll and dirty:
+            now = time.monotonic()
+            if now - last_paint >= _REPAINT_INTERVAL:
+                repaint()
+                last_paint = now
+                dirty = False
+
+    pending = pending.strip()
+    if pending:
+        output_buffer.append(pending)
+        dirty = True
+
+    process.stdout.close()
+    returncode = process.wait()
+
+    if scroll:
+        if dirty:
+            repaint()
+        print()  # 换行
+    else:
+        from ..core.logger import get_logger
+
+        logger = get_logger()
+        for line in output_buffer:
+            logger.info_print(f"  {line.decode('utf-8', errors='replace')}")
+
+    return returncode
+
+
+@lru_cache(maxsize=64)
 def find_command(name: str) -> Optional[str]:
-    """查找系统中的命令
+    """查找系统中的命令（结果按名称缓存，安装新命令后需 find_command.cache_clear()）
 
     Args:
         name: 命令名称
@@ -129,6 +297,18 @@ def check_command(name: str) -> bool:
     return find_command(name) is not None
 
 
+def ensure_file(path: str) -> None:
+    """确保文件存在（不存在则创建空文件，已存在时不修改内容）
+
+    Args:
+        path: 文件路径
+    """
+    import os
+
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_APPEND, 0o644)
+    os.close(fd)
+
+
 def get_editor() -> str:
     """获取系统默认编辑器"""
     import os
@@ -153,8 +333,10 @@ from .requirements import (
 __all__ = [
     "run_command",
     "run_command_stream",
+    "run_with_tail_output",
     "find_command",
     "check_command",
+    "ensure_file",
     "get_editor",
     "get_requirements_file",
     "get_requirements_info",
@@ -3,10 +3,22 @@
 交互式输入工具
 """
 
-from typing import Any, Optional
+from typing import Optional
 
+from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
+# 所有交互共用的 Console，首次使用时创建
+_console: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """获取共享的 Console 实例"""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 def ask(
     question: str,
@@ -25,9 +37,7 @@ def ask(
     Returns:
         用户输入的值
     """
-    from rich.console import Console
-
-    console = Console()
+    console = _get_console()
     result = Prompt.ask(
         question,
         default=default,
@@ -62,9 +72,7 @@ def select(question: str, choices: list[str], default: Optional[int] = None) ->
     Returns:
         选择的值
     """
-    from rich.console import Console
-
-    console = Console()
+    console = _get_console()
     console.print(f"\n[bold cyan]{question}[/bold cyan]")
 
     for i, choice in enumerate(choices):
@@ -119,9 +127,7 @@ def select_multiple(
     Returns:
         选择的值列表
     """
-    from rich.console import Console
-
-    console = Console()
+    console = _get_console()
     console.print(f"\n[bold cyan]{question}[/bold cyan]")
     console.print("[dim]提示: 输入数字用空格分隔，如: 0 1 3[/dim]")
 
@@ -144,23 +150,21 @@ def select_multiple(
                 continue
 
             # 解析输入
-            indices = []
-            for part in answer.strip().split():
-                if not part.isdigit():
-                    console.print("[red]无效的输入，请输入用空格分隔的数字[/red]")
-                    break
-                indices.append(int(part))
+            try:
+                indices = [int(part) for part in answer.split()]
+            except ValueError:
+                console.print("[red]无效的输入，请输入用空格分隔的数字[/red]")
+                continue
 
             # 检查范围
-            if any(i < 0 or i >= len(choices) for i in indices):
+            if indices and (min(indices) < 0 or max(indices) >= len(choices)):
                 console.print(f"[red]选择超出范围 (0-{len(choices)-1})，请重试[/red]")
                 continue
 
-            # 检查重复
-            unique_indices = list(dict.fromkeys(indices))  # 保持顺序去重
-            if len(unique_indices) < len(indices):
+            # 检查重复（仅在确有重复时才保持顺序去重）
+            if len(set(indices)) != len(indices):
                 console.print("[yellow]已去除重复的选择[/yellow]")
-                indices = unique_indices
+                indices = list(dict.fromkeys(indices))
 
             # 检查数量
             if len(indices) < min_select:
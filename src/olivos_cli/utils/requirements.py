@@ -3,13 +3,85 @@
 Requirements 文件选择工具
 """
 
+import os
 import platform
-import re
 import sys
 from pathlib import Path
+from typing import Optional
+
+# 运行环境信息（进程内不变，导入时计算一次）
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_PY312 = sys.version_info >= (3, 12)
+_PY_VER_STR = f"{sys.version_info.major}.{sys.version_info.minor}"
 
 # Pillow 最低版本要求（用于 Python 3.12+）
 PILLOW_MIN_VERSION_PY312 = "10.0.0"
+_PILLOW_MIN_MAJOR = int(PILLOW_MIN_VERSION_PY312.partition(".")[0])
+
+# 读取 requirements 文件的块大小
+_READ_CHUNK_SIZE = 8192
+
+# 无警告时共享的空结果，避免每次调用都分配列表
+_NO_WARNINGS: tuple[str, ...] = ()
+
+# (是否 Windows, 是否 Python 3.12+) -> 按优先级排列的 requirements 文件名
+# Python 3.12+ 需要 requirements312
+_CANDIDATES = {
+    (True, True): (
+        "requirements312_win.txt",
+        "requirements312.txt",
+        "requirements310_win.txt",
+        "requirements.txt",
+    ),
+    (True, False): ("requirements310_win.txt", "requirements.txt"),
+    (False, True): ("requirements312.txt", "requirements310.txt", "requirements.txt"),
+    (False, False): ("requirements310.txt", "requirements.txt"),
+}
+
+
+def _find_pillow_pin(content: str) -> Optional[str]:
+    """查找 `pillow == <版本>` 形式的固定版本要求（包名不区分大小写）
+
+    Returns:
+        版本号字符串（由数字和点组成），未找到时返回 None
+    """
+    # 版本号只含数字和点，小写化不影响截取结果
+    text = content.lower()
+    n = len(text)
+    idx = text.find("pillow")
+    while idx != -1:
+        i = idx + 6
+        while i < n and text[i].isspace():
+            i += 1
+        if text.startswith("==", i):
+            i += 2
+            while i < n and text[i].isspace():
+                i += 1
+            j = i
+            while j < n and (text[j].isdecimal() or text[j] == "."):
+                j += 1
+            if j > i:
+                return text[i:j]
+        idx = text.find("pillow", idx + 1)
+    return None
+
+
+def _read_pillow_pin(requirements_file: Path) -> Optional[str]:
+    """按块读取 requirements 文件，找到 Pillow 固定版本后即停止读取"""
+    pillow_version = None
+    tail = b""
+    with open(requirements_file, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            # 只检查完整的行，最后不完整的一行留到下一块
+            head, _, tail = (tail + chunk).rpartition(b"\n")
+            if head:
+                pillow_version = _find_pillow_pin(head.decode("utf-8", errors="replace"))
+                if pillow_version:
+                    return pillow_version
+    if tail:
+        pillow_version = _find_pillow_pin(tail.decode("utf-8", errors="replace"))
+    return pillow_version
 
 
 def get_requirements_file(install_path: Path) -> Path:
@@ -25,90 +97,63 @@ def get_requirements_file(install_path: Path) -> Path:
     Returns:
         requirements 文件路径
     """
-    python_version = sys.version_info
-    system = platform.system()
+    return _find_requirements_file(install_path)[0]
+
 
+def _find_requirements_file(install_path: Path) -> tuple[Path, bool]:
+    """查找 requirements 文件，同时返回其是否存在（避免调用方再次 stat）"""
     # 根据系统和 Python 版本选择
-    if system == "Windows":
-        if python_version >= (3, 12):
-            # Python 3.12+ 需要 requirements312
-            candidates = [
-                install_path / "requirements312_win.txt",
-                install_path / "requirements312.txt",
-                install_path / "requirements310_win.txt",
-                install_path / "requirements.txt",
-            ]
-        else:
-            candidates = [
-                install_path / "requirements310_win.txt",
-                install_path / "requirements.txt",
-            ]
-    else:
-        if python_version >= (3, 12):
-            # Python 3.12+ 需要 requirements312
-            candidates = [
-                install_path / "requirements312.txt",
-                install_path / "requirements310.txt",
-                install_path / "requirements.txt",
-            ]
-        else:
-            candidates = [
-                install_path / "requirements310.txt",
-                install_path / "requirements.txt",
-            ]
-
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+    names = _CANDIDATES[_IS_WINDOWS, _IS_PY312]
+
+    # 一次读取目录项，代替逐个候选文件 stat
+    try:
+        with os.scandir(install_path) as it:
+            present = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        present = set()
+
+    for name in names:
+        if name in present:
+            return install_path / name, True
 
     # 如果都不存在，返回默认
-    return install_path / "requirements.txt"
+    return install_path / "requirements.txt", False
 
 
-def check_requirements_compatibility(requirements_file: Path) -> list[str]:
+def check_requirements_compatibility(requirements_file: Path) -> tuple[str, ...]:
     """检查 requirements 文件与当前 Python 版本的兼容性
 
     Args:
         requirements_file: requirements 文件路径
 
     Returns:
-        警告信息列表
+        警告信息元组
     """
-    warnings = []
-    python_version = sys.version_info
-
-    if not requirements_file.exists():
-        return warnings
-
-    # 只检查 Python 3.12+ 的 Pillow 兼容性
-    if python_version >= (3, 12):
-        try:
-            with open(requirements_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # 查找 Pillow 版本要求
-            pillow_match = re.search(r"[Pp]illow\s*==\s*([\d.]+)", content)
-            if pillow_match:
-                pillow_version = pillow_match.group(1)
-                # 简单的版本比较
-                pillow_parts = pillow_version.split(".")
-                min_parts = PILLOW_MIN_VERSION_PY312.split(".")
-
-                # 如果 Pillow 版本小于 10.0.0
-                if len(pillow_parts) >= 1:
-                    try:
-                        if int(pillow_parts[0]) < int(min_parts[0]):
-                            warnings.append(
-                                f"检测到 Pillow 版本 {pillow_version} 与 Python 3.12+ 不兼容\n"
-                                f"  Pillow {PILLOW_MIN_VERSION_PY312}+ 才支持 Python 3.12+\n"
-                                f"  建议使用系统 Pillow: sudo pacman -S python-pillow"
-                            )
-                    except ValueError:
-                        pass
-        except Exception:
-            pass
-
-    return warnings
+    # 只检查 Python 3.12+ 的 Pillow 兼容性，其他版本无需读取文件
+    if not _IS_PY312:
+        return _NO_WARNINGS
+
+    # 查找 Pillow 版本要求；文件不存在时由 open() 抛出异常，不再单独 stat
+    try:
+        pillow_version = _read_pillow_pin(requirements_file)
+    except OSError:
+        return _NO_WARNINGS
+
+    if not pillow_version:
+        return _NO_WARNINGS
+
+    # 只需比较主版本号：如果 Pillow 版本小于 10.0.0
+    try:
+        if int(pillow_version.partition(".")[0]) >= _PILLOW_MIN_MAJOR:
+            return _NO_WARNINGS
+    except ValueError:
+        return _NO_WARNINGS
+
+    return (
+        f"检测到 Pillow 版本 {pillow_version} 与 Python 3.12+ 不兼容\n"
+        f"  Pillow {PILLOW_MIN_VERSION_PY312}+ 才支持 Python 3.12+\n"
+        f"  建议使用系统 Pillow: sudo pacman -S python-pillow",
+    )
 
 
 def get_requirements_info(install_path: Path) -> dict:
@@ -120,13 +165,13 @@ def get_requirements_info(install_path: Path) -> dict:
     Returns:
         包含文件路径、名称、Python版本信息的字典
     """
-    requirements_file = get_requirements_file(install_path)
+    requirements_file, exists = _find_requirements_file(install_path)
 
     return {
         "path": requirements_file,
         "name": requirements_file.name,
-        "exists": requirements_file.exists(),
-        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
-        "system": platform.system(),
+        "exists": exists,
+        "python_version": _PY_VER_STR,
+        "system": _SYSTEM,
         "warnings": check_requirements_compatibility(requirements_file),
     }
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+依赖解析结果缓存
+
+按 (依赖文件及其引用文件的内容、索引地址、目标解释器) 记录该依赖文件的解析结果
+（如 `uv pip compile` 的输出），输入未变化时可直接按锁定版本安装，跳过依赖解析。
+"""
+
+import hashlib
+import os
+import platform
+import sys
+from pathlib import Path
+from typing import Optional
+
+from ..core.const import CACHE_DIR
+
+RESOLVE_CACHE_DIR = CACHE_DIR / "resolve"
+
+# 依赖文件中引用其他文件的选项
+_INCLUDE_OPTIONS = ("-r", "-c", "--requirement", "--constraint")
+
+
+def _included_file(requirements: Path, line: str) -> Optional[Path]:
+    """解析依赖文件中的 -r / -c 引用行，返回被引用的文件路径"""
+    for option in _INCLUDE_OPTIONS:
+        if not line.startswith(option):
+            continue
+        rest = line[len(option):]
+        if rest[:1] == "=":
+            rest = rest[1:]
+        elif option.startswith("--") and rest[:1] not in (" ", "\t"):
+            continue
+        rest = rest.split(" #", 1)[0].strip()
+        if rest:
+            return requirements.parent / rest
+    return None
+
+
+def _hash_requirements(digest, requirements: Path, seen: set) -> None:
+    """把依赖文件及其递归引用的文件内容写入摘要"""
+    path = requirements.resolve()
+    if path in seen:
+        return
+    seen.add(path)
+    digest.update(str(path).encode("utf-8") + b"\0")
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        # 引用的文件不存在时也要区分于存在的情况
+        digest.update(b"<missing>\0")
+        return
+    digest.update(data + b"\0")
+    for line in data.decode("utf-8", "replace").splitlines():
+        include = _included_file(path, line.strip())
+        if include is not None:
+            _hash_requirements(digest, include, seen)
+
+
+def cache_key(requirements: Path, python_tag: str, index_url: Optional[str] = None) -> Optional[str]:
+    """计算依赖文件的缓存键
+
+    Args:
+        requirements: 依赖文件路径
+        python_tag: 安装目标解释器的标识（实现与版本，如 cpython-3.12.1）
+        index_url: 解析时使用的索引地址
+
+    Returns:
+        缓存键，依赖文件无法读取时返回 None
+    """
+    digest = hashlib.sha256()
+    try:
+        if not requirements.is_file():
+            return None
+        _hash_requirements(digest, requirements, set())
+    except OSError:
+        return None
+    digest.update(f"{index_url or ''}\0{sys.platform}\0{platform.machine()}".encode("utf-8"))
+    return f"{digest.hexdigest()}-{python_tag}"
+
+
+def lookup(key: str) -> Optional[Path]:
+    """查找缓存的锁定版本文件，未命中时返回 None"""
+    cache_file = RESOLVE_CACHE_DIR / f"{key}.txt"
+    return cache_file if cache_file.is_file() else None
+
+
+def store(key: str, pinned: str) -> Optional[Path]:
+    """保存解析结果（锁定版本列表）
+
+    Returns:
+        缓存文件路径，写入失败时返回 None
+    """
+    cache_file = RESOLVE_CACHE_DIR / f"{key}.txt"
+    try:
+        RESOLVE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(cache_file.name + ".tmp")
+        tmp.write_text(pinned, encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        return None
+    return cache_file
+
+
+def invalidate(key: str) -> None:
+    """删除缓存的解析结果"""
+    try:
+        (RESOLVE_CACHE_DIR / f"{key}.txt").unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+__all__ = ["RESOLVE_CACHE_DIR", "cache_key", "lookup", "store", "invalidate"]
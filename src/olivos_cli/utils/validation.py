@@ -3,12 +3,28 @@
 验证工具
 """
 
-import re
-from typing import Any, Optional
+import string
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+# 邮箱本地部分与域名部分允许的字符
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+# Git 分支名规则：删除所有允许的字符后应为空
+_GIT_BRANCH_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_-./")
+# commit hash 允许的十六进制字符
+_HEX_CHARS = frozenset(string.hexdigits)
 
 
 def validate_port(port: Any) -> bool:
     """验证端口号"""
+    # 常见的 int / str 输入直接判断，不走异常路径
+    t = type(port)
+    if t is int:
+        return 1 <= port <= 65535
+    if t is str:
+        port = port.strip()
+        return port.isdecimal() and 1 <= int(port) <= 65535
     try:
         p = int(port)
         return 1 <= p <= 65535
@@ -21,20 +37,25 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
     try:
-        from urllib.parse import urlparse
-
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
 
 def validate_email(email: str) -> bool:
     """验证邮箱格式"""
-    if not email:
+    # 逐字符检查：本地部分@域名.顶级域名（顶级域名至少 2 个字母）
+    if not email or not email.isascii():
+        return False
+    at = email.rfind("@")
+    if at <= 0 or not _EMAIL_LOCAL_CHARS.issuperset(email[:at]):
+        return False
+    domain = email[at + 1:]
+    dot = domain.rfind(".")
+    if dot <= 0 or len(domain) - dot - 1 < 2:
         return False
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return _EMAIL_DOMAIN_CHARS.issuperset(domain) and domain[dot + 1:].isalpha()
 
 
 def validate_account_id(account_id: Any) -> bool:
@@ -42,10 +63,8 @@ def validate_account_id(account_id: Any) -> bool:
     if isinstance(account_id, int):
         return account_id > 0
     if isinstance(account_id, str):
-        try:
-            return int(account_id) > 0
-        except ValueError:
-            return False
+        account_id = account_id.strip()
+        return account_id.isdecimal() and int(account_id) > 0
     return False
 
 
@@ -53,21 +72,46 @@ def validate_git_branch(branch: str) -> bool:
     """验证 Git 分支名"""
     if not branch:
         return False
-    # Git 分支名规则
-    pattern = r"^[a-zA-Z0-9_\-./]+$"
-    return bool(re.match(pattern, branch))
+    return not branch.translate(_GIT_BRANCH_TABLE)
 
 
 def validate_commit_hash(hash_str: str) -> bool:
     """验证 Git commit hash"""
+    # 7-40 位的十六进制
     if not hash_str:
         return False
-    # 7-40 位的十六进制
-    pattern = r"^[0-9a-fA-F]{7,40}$"
-    return bool(re.match(pattern, hash_str))
+    return 7 <= len(hash_str) <= 40 and _HEX_CHARS.issuperset(hash_str)
+
+
+# 校验类型 -> 校验函数
+_VALIDATORS: dict[str, Callable[[Any], bool]] = {
+    "port": validate_port,
+    "url": validate_url,
+    "email": validate_email,
+    "account_id": validate_account_id,
+    "git_branch": validate_git_branch,
+    "commit_hash": validate_commit_hash,
+}
+
+
+def validate(kind: str, value: Any) -> bool:
+    """按校验类型名称校验值
+
+    Args:
+        kind: 校验类型（port、url、email、account_id、git_branch、commit_hash）
+        value: 待校验的值
+
+    Returns:
+        是否有效
+
+    Raises:
+        KeyError: 未知的校验类型
+    """
+    return _VALIDATORS[kind](value)
 
 
 __all__ = [
+    "validate",
     "validate_port",
     "validate_url",
     "validate_email",